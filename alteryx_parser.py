@@ -2,6 +2,7 @@
 Alteryx workflow XML parser.
 Parses .yxmd and .yxmc files to extract nodes, connections, and configurations.
 """
+import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Optional, Dict, Any, List, Tuple
@@ -49,10 +50,6 @@ class AlteryxParser:
             connections=connections,
         )
 
-        # Identify sources and targets
-        workflow.sources = [n for n in nodes if n.category == ToolCategory.INPUT]
-        workflow.targets = [n for n in nodes if n.category == ToolCategory.OUTPUT]
-
         # Identify macros
         for node in nodes:
             if node.is_macro and node.macro_path:
@@ -440,7 +437,7 @@ class AlteryxParser:
         # Join type
         select_join = config_elem.find('.//SelectJoinInfo')
         if select_join is not None:
-            node.join_type = select_join.get('connection', 'Inner')
+            node.join_type = sys.intern(select_join.get('connection', 'Inner'))
 
     def _parse_summarize_config(self, config_elem: ET.Element, node: AlteryxNode, config: Dict):
         """Parse summarize tool configuration."""
@@ -8,7 +8,9 @@ SQL Dialect: Trino SQL
 import os
 import re
 import csv
+import string
 import json
+import functools
 from pathlib import Path
 from typing import List, Dict, Set, Optional, Tuple
 from datetime import datetime
@@ -19,8 +21,178 @@ from models import (
 )
 from transformation_analyzer import TransformationAnalyzer
 from tool_mappings import get_dbt_prefix, AGGREGATION_MAP
-from quality_validator import QualityValidator, create_validation_seed_template
 from formula_converter import FormulaConverter, convert_aggregation
+from file_writer import write_files_concurrently
+
+# Precompiled patterns used on the generation hot paths
+_SANITIZE_NON_ALNUM = re.compile(r'[^a-zA-Z0-9_]')
+_SANITIZE_COLLAPSE = re.compile(r'_+')
+_SELECT_CLAUSE_RE = re.compile(r'SELECT\s+(.+?)\s+FROM', re.DOTALL)
+_COLUMN_ALIAS_RE = re.compile(r'\s+AS\s+(\w+)\s*$', re.IGNORECASE)
+_CONN_DATABASE_RE = re.compile(r'database=([^;]+)')
+_FROM_TABLE_RE = re.compile(r'\bFROM\s+([^\s,()]+)', re.IGNORECASE)
+_IIF_CALL_RE = re.compile(r'\bIIF\s*\(', re.IGNORECASE)
+_ISNULL_CALL_RE = re.compile(r'\bIsNull\s*\(', re.IGNORECASE)
+_ISEMPTY_CALL_RE = re.compile(r'\bIsEmpty\s*\(', re.IGNORECASE)
+
+# Static files written into the generated tests/ directory (pre-encoded; pure ASCII)
+_TEST_README_BYTES = b"""\
+# DBT Tests for Alteryx Migration
+#
+# This directory contains custom tests for validating migrated data.
+#
+# Test Types:
+# - generic/: Reusable test macros
+# - singular/: One-off SQL tests
+#
+# To run tests: dbt test
+"""
+
+_GENERIC_TEST_SQL_BYTES = b"""\
+-- Generic test: Check for null values in key columns
+-- Usage in schema.yml:
+--   tests:
+--     - not_null
+
+{% test not_null_percentage(model, column_name, max_null_pct=0.05) %}
+
+with validation as (
+    select
+        count(*) as total_rows,
+        sum(case when {{ column_name }} is null then 1 else 0 end) as null_rows
+    from {{ model }}
+)
+
+select *
+from validation
+where cast(null_rows as double) / cast(total_rows as double) > {{ max_null_pct }}
+
+{% endtest %}"""
+
+_TEST_EXAMPLES_YML_BYTES = b"""\
+version: 2
+
+# Add these tests to your model schema files
+# Example test configurations:
+
+# models:
+#   - name: your_model
+#     columns:
+#       - name: "id"
+#         tests:
+#           - unique
+#           - not_null
+#       - name: "foreign_key"
+#         tests:
+#           - not_null
+#           - relationships:
+#               to: ref('other_model')
+#               field: "id"
+"""
+
+# tests/-relative path -> content for every static file in the tests directory
+_STATIC_TEST_FILES: Tuple[Tuple[str, bytes], ...] = (
+    ("README.md", _TEST_README_BYTES),
+    ("generic/test_not_null_percentage.sql", _GENERIC_TEST_SQL_BYTES),
+    ("_test_examples.yml", _TEST_EXAMPLES_YML_BYTES),
+)
+
+# Singular test asserting that a gold model is not empty
+_ROW_COUNT_TEST_TEMPLATE = """\
+-- Singular test: Verify {model_name} has data
+-- This test fails if the model has zero rows
+
+select count(*) as row_count
+from {{{{ ref('{model_name}') }}}}
+having count(*) = 0"""
+
+# dbt_project.yml / profiles.yml bodies; only the project name and timestamp vary
+_DBT_PROJECT_TEMPLATE = string.Template("""\
+name: '$project_name'
+version: '1.0.0'
+config-version: 2
+
+# ============================================================
+# TARGET PLATFORM: Starburst (Trino-based)
+# ============================================================
+# This dbt project is configured for Starburst/Trino.
+# Ensure you have dbt-trino adapter installed:
+#   pip install dbt-trino
+# ============================================================
+
+profile: '$project_name'
+
+model-paths: ["models"]
+analysis-paths: ["analyses"]
+test-paths: ["tests"]
+seed-paths: ["seeds"]
+macro-paths: ["macros"]
+snapshot-paths: ["snapshots"]
+
+target-path: "target"
+clean-targets:
+  - "target"
+  - "dbt_packages"
+
+models:
+  $project_name:
+    bronze:
+      +materialized: table
+      +schema: bronze
+    silver:
+      +materialized: table
+      +schema: silver
+    gold:
+      +materialized: view
+      +schema: gold
+
+tests:
+  $project_name:
+    +severity: warn
+
+# Generated: $generated_at
+# Migrated from Alteryx ETL workflows to Starburst/Trino ELT.
+# Review and customize the models before running.""")
+
+_PROFILES_TEMPLATE = string.Template("""\
+# ============================================================
+# Starburst/Trino dbt Profile Configuration
+# ============================================================
+# Copy this file to ~/.dbt/profiles.yml and configure your connection.
+# Documentation: https://docs.getdbt.com/docs/core/connect-data-platform/trino-setup
+# ============================================================
+
+$project_name:
+  target: dev
+  outputs:
+    dev:
+      type: trino
+      method: ldap  # or 'none', 'kerberos', 'oauth', 'jwt', 'certificate'
+      host: your-starburst-host.company.com
+      port: 443
+      user: your_username
+      password: your_password  # Or use environment variable
+      catalog: your_catalog
+      schema: your_schema
+      http_scheme: https
+      threads: 4
+
+    prod:
+      type: trino
+      method: ldap
+      host: your-starburst-host.company.com
+      port: 443
+      user: "{{ env_var('DBT_USER') }}"
+      password: "{{ env_var('DBT_PASSWORD') }}"
+      catalog: your_catalog
+      schema: your_schema
+      http_scheme: https
+      threads: 8
+
+# Notes for Starburst Galaxy users:
+# - Use method: 'oauth' or 'jwt' for authentication
+# - Host format: your-cluster.galaxy.starburst.io
+# - See: https://docs.starburst.io/starburst-galaxy/""")
 
 
 @dataclass
@@ -66,6 +238,7 @@ class DBTGenerator:
         self.generate_validation = generate_validation  # Generate validation tests
         self.sources: Dict[str, Dict[str, SourceInfo]] = {}  # schema -> {table -> SourceInfo}
         self.models_info: Dict[str, ModelInfo] = {}  # model_name -> ModelInfo
+        self._models_by_layer: Dict[str, Dict[str, ModelInfo]] = {}  # layer -> {model_name -> ModelInfo}
         self.models_generated: List[str] = []
         self.macros_generated: List[str] = []  # Track generated macros
         self.validation_tests_generated: List[str] = []  # Track validation tests
@@ -77,6 +250,8 @@ class DBTGenerator:
         self._current_model_name: str = ""  # Track current model being generated
         self._current_layer: str = ""  # Track current layer
         self._formula_converter = FormulaConverter()  # Alteryx to Trino formula converter
+        self._pending_writes: Dict[Path, bytes] = {}  # path -> encoded content (flushed in batch)
+        self._run_ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')  # Stable timestamp for this run
 
     def generate(self, workflows: List[AlteryxWorkflow], macro_inventory=None) -> None:
         """Generate complete DBT project from workflows.
@@ -115,6 +290,9 @@ class DBTGenerator:
         # Generate dbt_project.yml
         self._generate_project_yml()
 
+        # Write all queued files to disk
+        self._flush_writes()
+
         print(f"DBT project generated at: {self.output_dir}")
         print(f"Models generated: {len(self.models_generated)}")
         if self.macros_generated:
@@ -124,24 +302,48 @@ class DBTGenerator:
         if self.todos:
             print(f"TODOs requiring attention: {len(self.todos)}")
 
+    def _register_model(self, info: ModelInfo) -> None:
+        """Record a generated model in models_info and the per-layer index."""
+        previous = self.models_info.get(info.name)
+        if previous is not None and previous.layer != info.layer:
+            del self._models_by_layer[previous.layer][info.name]
+        self.models_info[info.name] = info
+        self._models_by_layer.setdefault(info.layer, {})[info.name] = info
+
     def _add_todo(self, todo_type: str, description: str, context: str = "",
                   priority: str = "medium") -> None:
         """Track a TODO item that was generated in the scaffold."""
+        self.todos.append(self._make_todo(todo_type, description, context, priority))
+
+    def _make_todo(self, todo_type: str, description: str, context: str = "",
+                   priority: str = "medium", model_name: Optional[str] = None,
+                   layer: Optional[str] = None) -> TodoItem:
+        """Build a TodoItem without registering it.
+
+        model_name and layer default to the model currently being generated,
+        so callers outside the model loop can pass them explicitly instead of
+        mutating the generator's current-model state.
+        """
+        if model_name is None:
+            model_name = self._current_model_name
+        if layer is None:
+            layer = self._current_layer
+
         file_path = ""
-        if self._current_layer and self._current_model_name:
-            file_path = f"models/{self._current_layer}/{self._current_model_name}.sql"
-        elif self._current_model_name:
-            file_path = f"macros/{self._current_model_name}.sql"
+        if layer and model_name:
+            file_path = f"models/{layer}/{model_name}.sql"
+        elif model_name:
+            file_path = f"macros/{model_name}.sql"
 
-        self.todos.append(TodoItem(
+        return TodoItem(
             file_path=file_path,
-            model_name=self._current_model_name,
-            layer=self._current_layer or "unknown",
+            model_name=model_name,
+            layer=layer or "unknown",
             todo_type=todo_type,
             description=description,
             context=context,
             priority=priority,
-        ))
+        )
 
     def get_todos_summary(self) -> Dict:
         """Get a summary of all TODOs for documentation."""
@@ -494,11 +696,12 @@ class DBTGenerator:
                     field = self._quote_column(f.get('field', 'new_field'))
                     expr = self._convert_expression(f.get('expression', 'NULL'))
                     select_parts.append(f"{expr} as {field}")
+                select_block = ','.join("\n        " + p for p in select_parts)
 
                 return f"""{cte_name} as (
     -- {node.plugin_name}: {node.annotation or ''}
     select
-        {','.join(chr(10) + '        ' + p for p in select_parts)}
+        {select_block}
     from {source_cte}
 )"""
 
@@ -931,7 +1134,7 @@ class DBTGenerator:
         sql_upper = sql.upper()
 
         # Find SELECT ... FROM
-        select_match = re.search(r'SELECT\s+(.+?)\s+FROM', sql_upper, re.DOTALL)
+        select_match = _SELECT_CLAUSE_RE.search(sql_upper)
         if select_match:
             select_clause = sql[select_match.start(1):select_match.end(1)]
 
@@ -949,7 +1152,7 @@ class DBTGenerator:
 
                 # Get the alias or column name
                 # Handle "expression AS alias" or just "column_name"
-                as_match = re.search(r'\s+AS\s+(\w+)\s*$', part, re.IGNORECASE)
+                as_match = _COLUMN_ALIAS_RE.search(part)
                 if as_match:
                     columns.append(as_match.group(1))
                 else:
@@ -1107,15 +1310,14 @@ class DBTGenerator:
         """
         if not columns:
             return f"{indent}*\n{indent}/* TODO: specify columns */"
-        quoted = [self._quote_column(c) for c in columns]
-        return f",\n{indent}".join(quoted)
+        return f",\n{indent}".join(map(self._quote_column, columns))
 
     def _get_schema_name(self, node: AlteryxNode) -> str:
         """Determine schema name from source node."""
         if node.connection_string:
             conn_lower = node.connection_string.lower()
             if 'database=' in conn_lower:
-                match = re.search(r'database=([^;]+)', conn_lower)
+                match = _CONN_DATABASE_RE.search(conn_lower)
                 if match:
                     return self._sanitize_name(match.group(1))
 
@@ -1158,7 +1360,7 @@ class DBTGenerator:
             return None
 
         # Look for "FROM schema.table" or "FROM table"
-        match = re.search(r'\bFROM\s+([^\s,()]+)', sql, re.IGNORECASE)
+        match = _FROM_TABLE_RE.search(sql)
         if match:
             table_ref = match.group(1).strip('[]"\'`')
             # Get last part if qualified (schema.table)
@@ -1478,13 +1680,13 @@ class DBTGenerator:
             cols = self._extract_columns_from_node(node)
             all_columns.extend([c for c in cols if c not in all_columns])
 
-        self.models_info[model_name] = ModelInfo(
+        self._register_model(ModelInfo(
             name=model_name,
             layer="silver",
             columns=all_columns,
             description=f"Combined: {' -> '.join([n.plugin_name for n in chain])}",
             source_tool_id=chain[0].tool_id,
-        )
+        ))
 
     def _generate_chained_transformation_sql(self, chain: List[AlteryxNode],
                                               upstream: List[AlteryxNode],
@@ -1549,11 +1751,12 @@ class DBTGenerator:
                     field = self._quote_column(f.get('field', 'new_field'))
                     expr = self._convert_expression(f.get('expression', 'NULL'))
                     select_parts.append(f"{expr} as {field}")
+                select_block = ','.join("\n        " + p for p in select_parts)
 
                 return f"""{cte_name} as (
     -- {node.plugin_name}: {node.annotation or ''}
     select
-        {','.join(chr(10) + '        ' + p for p in select_parts)}
+        {select_block}
     from {source_cte}
 ),"""
 
@@ -1643,7 +1846,7 @@ class DBTGenerator:
 
         # Build column list with double quotes
         if columns:
-            col_list = ",\n        ".join([self._quote_column(c) for c in columns])
+            col_list = ",\n        ".join(map(self._quote_column, columns))
             select_clause = f"        {col_list}"
         else:
             select_clause = "        * -- TODO: Replace with explicit column list"
@@ -1656,9 +1859,10 @@ class DBTGenerator:
 
         # Build the source select with explicit columns
         if columns:
-            source_col_list = ",\n        ".join([self._quote_column(c) for c in columns])
+            source_col_list = ",\n        ".join(map(self._quote_column, columns))
             source_select = f"    select\n        {source_col_list}\n    from {{{{ source('{schema}', '{table}') }}}}"
-            final_select = f"select\n    {','.join(chr(10) + '    ' + self._quote_column(c) for c in columns)}\nfrom renamed"
+            final_col_list = ','.join("\n    " + self._quote_column(c) for c in columns)
+            final_select = f"select\n    {final_col_list}\nfrom renamed"
         else:
             source_select = f"    select *\n    /* TODO: specify columns */\n    from {{{{ source('{schema}', '{table}') }}}}"
             final_select = "select *\n/* TODO: specify columns */\nfrom renamed"
@@ -1698,13 +1902,13 @@ class DBTGenerator:
         self.models_generated.append(model_name)
 
         # Store model info for schema generation
-        self.models_info[model_name] = ModelInfo(
+        self._register_model(ModelInfo(
             name=model_name,
             layer="bronze",
             columns=columns,
             description=f"Staging model for {node.get_display_name()}",
             source_tool_id=node.tool_id,
-        )
+        ))
 
     def _generate_silver_model(self, node: AlteryxNode,
                                 workflow_prefix: str,
@@ -1748,7 +1952,7 @@ class DBTGenerator:
                 is_last = (i == len(ordered_upstream) - 1)
                 if up_columns:
                     col_list = self._format_column_list(up_columns)
-                    content.extend([
+                    content += (
                         f"with {cte_name} as (" if i == 0 else f"{cte_name} as (",
                         "",
                         f"    select",
@@ -1757,9 +1961,9 @@ class DBTGenerator:
                         "",
                         ")," if not is_last else "),",
                         "",
-                    ])
+                    )
                 else:
-                    content.extend([
+                    content += (
                         f"with {cte_name} as (" if i == 0 else f"{cte_name} as (",
                         "",
                         f"    select *",
@@ -1768,7 +1972,7 @@ class DBTGenerator:
                         "",
                         ")," if not is_last else "),",
                         "",
-                    ])
+                    )
                     self._add_todo(
                         todo_type="specify_columns",
                         description=f"Specify columns from upstream model '{up_model}'",
@@ -1783,7 +1987,7 @@ class DBTGenerator:
                 up_columns = self._get_node_columns(up_node, workflow)
                 if up_columns:
                     col_list = self._format_column_list(up_columns)
-                    content.extend([
+                    content += (
                         f"with {cte_name} as (",
                         "",
                         f"    select",
@@ -1792,9 +1996,9 @@ class DBTGenerator:
                         "",
                         ")," if i < len(upstream) - 1 else "),",
                         "",
-                    ])
+                    )
                 else:
-                    content.extend([
+                    content += (
                         f"with {cte_name} as (",
                         "",
                         f"    select *",
@@ -1803,7 +2007,7 @@ class DBTGenerator:
                         "",
                         ")," if i < len(upstream) - 1 else "),",
                         "",
-                    ])
+                    )
                     self._add_todo(
                         todo_type="specify_columns",
                         description=f"Specify columns from upstream model '{up_model}'",
@@ -1840,13 +2044,13 @@ class DBTGenerator:
 
         # Store model info
         columns = self._extract_columns_from_node(node)
-        self.models_info[model_name] = ModelInfo(
+        self._register_model(ModelInfo(
             name=model_name,
             layer="silver",
             columns=columns,
             description=f"Intermediate model: {node.plugin_name} - {node.get_display_name()}",
             source_tool_id=node.tool_id,
-        )
+        ))
 
     def _generate_gold_model(self, node: AlteryxNode,
                               workflow_prefix: str,
@@ -1893,7 +2097,7 @@ class DBTGenerator:
                 up_columns = self._get_node_columns(up_node, workflow)
                 if up_columns:
                     col_list = self._format_column_list(up_columns)
-                    content.extend([
+                    content += (
                         f"with {cte_name} as (",
                         "",
                         f"    select",
@@ -1902,9 +2106,9 @@ class DBTGenerator:
                         "",
                         ")," if i < len(upstream) - 1 else "),",
                         "",
-                    ])
+                    )
                 else:
-                    content.extend([
+                    content += (
                         f"with {cte_name} as (",
                         "",
                         f"    select *",
@@ -1913,7 +2117,7 @@ class DBTGenerator:
                         "",
                         ")," if i < len(upstream) - 1 else "),",
                         "",
-                    ])
+                    )
                     self._add_todo(
                         todo_type="specify_columns",
                         description=f"Specify columns from upstream model '{up_model}'",
@@ -1950,13 +2154,13 @@ class DBTGenerator:
 
         # Store model info with target columns
         columns = self._extract_columns_from_node(node)
-        self.models_info[model_name] = ModelInfo(
+        self._register_model(ModelInfo(
             name=model_name,
             layer="gold",
             columns=columns,
             description=f"Gold model: {node.get_display_name()} -> {node.target_path or node.table_name or 'output'}",
             source_tool_id=node.tool_id,
-        )
+        ))
 
     def _get_model_reference(self, node: AlteryxNode, workflow_prefix: str) -> str:
         """Get the model name to reference for a node."""
@@ -2035,20 +2239,20 @@ class DBTGenerator:
 
         Returns None if no macro mapping exists for this tool.
         """
-        from macro_mappings import get_macro_for_tool
+        from macro_mappings import MacroContext, get_macro_for_tool
 
         # Build context for macro selection (e.g., join type, operation)
-        context = {}
+        context = None
         if node.plugin_name == "Join":
-            context["join_type"] = node.join_type or "LEFT"
+            context = MacroContext(join_type=node.join_type or "LEFT")
         elif node.plugin_name == "Sample":
             # Determine sample type from configuration
             sample_config = node.configuration.get('sample_type', 'first')
-            context["sample_type"] = sample_config
+            context = MacroContext(sample_type=sample_config)
         elif node.plugin_name == "RegEx":
             # Determine regex operation from configuration
             regex_mode = node.configuration.get('mode', 'extract')
-            context["operation"] = regex_mode
+            context = MacroContext(operation=regex_mode)
 
         # Get macro mapping for this tool
         macro_info = get_macro_for_tool(node.plugin_name, context)
@@ -2337,10 +2541,12 @@ from final"""
                 else:
                     final_select = "select *\n/* TODO: specify columns */\nfrom final"
 
+                select_block = "\n".join(select_parts)
+
                 return f"""final as (
 
     select
-{chr(10).join(select_parts)}
+{select_block}
     from {source_cte}
 
 )
@@ -2558,6 +2764,23 @@ from final"""
         if not expr:
             return "NULL"
 
+        # Short-circuit trivial expressions (keyword, integer, bare column, quoted
+        # literal). Two results intentionally differ from the formula converter:
+        # NULL/TRUE/FALSE come back upper-cased, and a quoted literal is returned
+        # verbatim instead of having operators inside it rewritten (the converter
+        # turns 'a && b' into 'a  AND  b'). A bare [Field] is quoted directly.
+        s = expr.strip()
+        if not s:
+            return "NULL"
+        if s.upper() in ("NULL", "TRUE", "FALSE"):
+            return s.upper()
+        if s.isdigit() or (s[0] == '-' and s[1:].isdigit()):
+            return s
+        if len(s) > 2 and s[0] == '[' and s[-1] == ']' and not any(c in s[1:-1] for c in '[]"'):
+            return self._quote_column(s[1:-1])
+        if len(s) > 1 and s[0] in ("'", '"') and s[-1] == s[0] and s[0] not in s[1:-1]:
+            return s
+
         # Use the comprehensive formula converter
         sql = self._formula_converter.convert(expr)
 
@@ -2630,7 +2853,7 @@ from final"""
 
         while iteration < max_iterations:
             # Find IIF( (case insensitive)
-            iif_match = re.search(r'\bIIF\s*\(', result, re.IGNORECASE)
+            iif_match = _IIF_CALL_RE.search(result)
             if not iif_match:
                 break
 
@@ -2676,7 +2899,7 @@ from final"""
         iteration = 0
 
         while iteration < max_iterations:
-            match = re.search(r'\bIsNull\s*\(', result, re.IGNORECASE)
+            match = _ISNULL_CALL_RE.search(result)
             if not match:
                 break
 
@@ -2702,7 +2925,7 @@ from final"""
         iteration = 0
 
         while iteration < max_iterations:
-            match = re.search(r'\bIsEmpty\s*\(', result, re.IGNORECASE)
+            match = _ISEMPTY_CALL_RE.search(result)
             if not match:
                 break
 
@@ -2725,7 +2948,7 @@ from final"""
         """Generate schema.yml with proper column names for each layer."""
         # Generate separate schema files for each layer
         for layer in ['bronze', 'silver', 'gold']:
-            layer_models = {k: v for k, v in self.models_info.items() if v.layer == layer}
+            layer_models = self._models_by_layer.get(layer)
 
             if not layer_models:
                 continue
@@ -2770,103 +2993,22 @@ from final"""
         """Generate dbt tests for data quality."""
         # Generate generic tests in schema files (already done via columns)
 
-        # Generate test configuration file
-        test_content = [
-            "# DBT Tests for Alteryx Migration",
-            "#",
-            "# This directory contains custom tests for validating migrated data.",
-            "#",
-            "# Test Types:",
-            "# - generic/: Reusable test macros",
-            "# - singular/: One-off SQL tests",
-            "#",
-            "# To run tests: dbt test",
-            "",
-        ]
-
-        self._write_file(
-            self.output_dir / "tests" / "README.md",
-            "\n".join(test_content)
+        # Queue the static README, generic test macro and test examples together
+        tests_dir = self.output_dir / "tests"
+        self._pending_writes.update(
+            (tests_dir / rel_path, data) for rel_path, data in _STATIC_TEST_FILES
         )
 
-        # Generate generic test macros
-        generic_tests = [
-            "-- Generic test: Check for null values in key columns",
-            "-- Usage in schema.yml:",
-            "--   tests:",
-            "--     - not_null",
-            "",
-            "{% test not_null_percentage(model, column_name, max_null_pct=0.05) %}",
-            "",
-            "with validation as (",
-            "    select",
-            "        count(*) as total_rows,",
-            "        sum(case when {{ column_name }} is null then 1 else 0 end) as null_rows",
-            "    from {{ model }}",
-            ")",
-            "",
-            "select *",
-            "from validation",
-            "where cast(null_rows as double) / cast(total_rows as double) > {{ max_null_pct }}",
-            "",
-            "{% endtest %}",
+        # Generate singular tests for each gold model with known columns
+        gold_with_columns = [
+            name for name, info in self._models_by_layer.get("gold", {}).items() if info.columns
         ]
-
-        self._write_file(
-            self.output_dir / "tests" / "generic" / "test_not_null_percentage.sql",
-            "\n".join(generic_tests)
-        )
-
-        # Generate singular tests for each gold model
-        for model_name, model_info in self.models_info.items():
-            if model_info.layer == "gold" and model_info.columns:
-                test_name = f"test_{model_name}_row_count"
-                test_sql = [
-                    f"-- Singular test: Verify {model_name} has data",
-                    f"-- This test fails if the model has zero rows",
-                    "",
-                    f"select count(*) as row_count",
-                    f"from {{{{ ref('{model_name}') }}}}",
-                    "having count(*) = 0",
-                ]
-
-                self._write_file(
-                    self.output_dir / "tests" / "singular" / f"{test_name}.sql",
-                    "\n".join(test_sql)
-                )
-
-        # Generate test schema additions for key columns
-        self._generate_test_schema()
-
-    def _generate_test_schema(self) -> None:
-        """Generate schema tests for important columns."""
-        # Create a tests schema file with common tests
-        content = [
-            "version: 2",
-            "",
-            "# Add these tests to your model schema files",
-            "# Example test configurations:",
-            "",
-            "# models:",
-            "#   - name: your_model",
-            "#     columns:",
-            "#       - name: \"id\"",
-            "#         tests:",
-            "#           - unique",
-            "#           - not_null",
-            "#       - name: \"foreign_key\"",
-            "#         tests:",
-            "#           - not_null",
-            "#           - relationships:",
-            "#               to: ref('other_model')",
-            "#               field: \"id\"",
-            "",
-        ]
-
-        self._write_file(
-            self.output_dir / "tests" / "_test_examples.yml",
-            "\n".join(content)
-        )
+        singular_dir = self.output_dir / "tests" / "singular"
+        for model_name in gold_with_columns:
+            self._write_file(
+                singular_dir / f"test_{model_name}_row_count.sql",
+                _ROW_COUNT_TEST_TEMPLATE.format(model_name=model_name)
+            )
 
     def _generate_validation_tests(self) -> None:
         """Generate validation tests for parallel comparison between Alteryx and DBT.
@@ -2877,6 +3019,15 @@ from final"""
         - Null value completeness per output field
         - Layer-to-layer validation (bronze vs raw, silver vs staging, gold vs fed)
         """
+        # Nothing to validate without models
+        if not self.models_info:
+            return
+
+        # Imported here so runs with validation disabled never load the module
+        from quality_validator import (
+            QualityValidator, ValidationReport, create_validation_seed_template
+        )
+
         validator = QualityValidator(str(self.output_dir))
 
         # Generate validation test files
@@ -2890,7 +3041,6 @@ from final"""
         self.validation_tests_generated.append(seed_file)
 
         # Generate validation documentation
-        from quality_validator import ValidationReport
         report = ValidationReport(
             report_name=f"{self.project_name}_validation",
             total_tables_validated=len(self.models_info),
@@ -2905,119 +3055,35 @@ from final"""
             str(self.output_dir / "docs" / "VALIDATION.md")
         )
 
-        # Add TODO for validation setup
-        self._current_model_name = "validation"
-        self._current_layer = "tests"
-        self._add_todo(
+        self.todos.append(self._make_todo(
             "validation_setup",
             "Configure Alteryx output sources for parallel validation",
             "Update seeds/alteryx_expected_counts.csv with actual Alteryx output counts",
-            priority="high"
-        )
+            priority="high",
+            model_name="validation",
+            layer="tests",
+        ))
 
     def _generate_project_yml(self) -> None:
         """Generate dbt_project.yml for Starburst/Trino with bronze/silver/gold layers."""
-        content = f"""
-name: '{self.project_name}'
-version: '1.0.0'
-config-version: 2
-
-# ============================================================
-# TARGET PLATFORM: Starburst (Trino-based)
-# ============================================================
-# This dbt project is configured for Starburst/Trino.
-# Ensure you have dbt-trino adapter installed:
-#   pip install dbt-trino
-# ============================================================
-
-profile: '{self.project_name}'
-
-model-paths: ["models"]
-analysis-paths: ["analyses"]
-test-paths: ["tests"]
-seed-paths: ["seeds"]
-macro-paths: ["macros"]
-snapshot-paths: ["snapshots"]
-
-target-path: "target"
-clean-targets:
-  - "target"
-  - "dbt_packages"
-
-models:
-  {self.project_name}:
-    bronze:
-      +materialized: table
-      +schema: bronze
-    silver:
-      +materialized: table
-      +schema: silver
-    gold:
-      +materialized: view
-      +schema: gold
-
-tests:
-  {self.project_name}:
-    +severity: warn
-
-# Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-# Migrated from Alteryx ETL workflows to Starburst/Trino ELT.
-# Review and customize the models before running.
-"""
-
-        self._write_file(self.output_dir / "dbt_project.yml", content.strip())
+        content = _DBT_PROJECT_TEMPLATE.substitute(
+            project_name=self.project_name,
+            generated_at=self._run_ts,
+        )
+        self._write_file(self.output_dir / "dbt_project.yml", content)
 
         # Also generate a profiles.yml template
-        profiles_content = f"""
-# ============================================================
-# Starburst/Trino dbt Profile Configuration
-# ============================================================
-# Copy this file to ~/.dbt/profiles.yml and configure your connection.
-# Documentation: https://docs.getdbt.com/docs/core/connect-data-platform/trino-setup
-# ============================================================
+        profiles_content = _PROFILES_TEMPLATE.substitute(project_name=self.project_name)
+        self._write_file(self.output_dir / "profiles.yml.template", profiles_content)
 
-{self.project_name}:
-  target: dev
-  outputs:
-    dev:
-      type: trino
-      method: ldap  # or 'none', 'kerberos', 'oauth', 'jwt', 'certificate'
-      host: your-starburst-host.company.com
-      port: 443
-      user: your_username
-      password: your_password  # Or use environment variable
-      catalog: your_catalog
-      schema: your_schema
-      http_scheme: https
-      threads: 4
-
-    prod:
-      type: trino
-      method: ldap
-      host: your-starburst-host.company.com
-      port: 443
-      user: "{{{{ env_var('DBT_USER') }}}}"
-      password: "{{{{ env_var('DBT_PASSWORD') }}}}"
-      catalog: your_catalog
-      schema: your_schema
-      http_scheme: https
-      threads: 8
-
-# Notes for Starburst Galaxy users:
-# - Use method: 'oauth' or 'jwt' for authentication
-# - Host format: your-cluster.galaxy.starburst.io
-# - See: https://docs.starburst.io/starburst-galaxy/
-"""
-
-        self._write_file(self.output_dir / "profiles.yml.template", profiles_content.strip())
-
-    def _sanitize_name(self, name: str) -> str:
-        """Sanitize a name for use in DBT."""
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _sanitize_name(name: str) -> str:
+        """Sanitize a name for use in DBT (memoized; the same names recur across models)."""
         if not name:
             return "unknown"
 
-        sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', name)
-        sanitized = re.sub(r'_+', '_', sanitized)
+        sanitized = _SANITIZE_COLLAPSE.sub('_', _SANITIZE_NON_ALNUM.sub('_', name))
         sanitized = sanitized.strip('_').lower()
 
         if len(sanitized) > 50:
@@ -3026,7 +3092,18 @@ tests:
         return sanitized or "unknown"
 
     def _write_file(self, path: Path, content: str) -> None:
-        """Write content to a file, creating parent directories if needed."""
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        """Queue content to be written to a file on the next flush.
+
+        Later writes to the same path replace earlier ones, matching the
+        overwrite semantics of writing each file immediately.
+        """
+        self._write_bytes(path, content.encode('utf-8'))
+
+    def _write_bytes(self, path: Path, data: bytes) -> None:
+        """Queue already-encoded content to be written to a file on the next flush."""
+        self._pending_writes[path] = data
+
+    def _flush_writes(self) -> None:
+        """Write all queued files, creating parent directories if needed."""
+        write_files_concurrently(self._pending_writes.items())
+        self._pending_writes.clear()
@@ -4,7 +4,10 @@ Generates Markdown documentation with Mermaid diagrams.
 
 Target Platform: Starburst (Trino-based)
 """
+import io
 import os
+import re
+from collections import defaultdict
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
@@ -14,6 +17,69 @@ from models import (
 )
 from transformation_analyzer import TransformationAnalyzer
 from macro_handler import MacroInventory
+from file_writer import write_files_concurrently
+
+
+# Medallion layer keys used by TransformationAnalyzer.suggest_medallion_mapping
+_BRONZE = MedallionLayer.BRONZE.value
+_SILVER = MedallionLayer.SILVER.value
+_GOLD = MedallionLayer.GOLD.value
+
+# Model-name sanitization: each run of special characters becomes one underscore
+_RE_SANITIZE = re.compile(r'[^a-zA-Z0-9_]+')
+_RE_MULTI_UNDERSCORE = re.compile(r'_{2,}')
+# Names that are already valid model names and pass through unchanged
+_RE_CLEAN_NAME = re.compile(r'[a-z0-9]+(?:_[a-z0-9]+)*')
+
+# Mermaid node labels: characters that would break the node syntax
+_MERMAID_TRANS = str.maketrans({'"': "'", '[': '(', ']': ')'})
+
+# Default output anchors; edges from any other anchor are labelled
+_STD_ANCHORS = frozenset(("Output", "Output1"))
+
+# Static "How to Complete TODOs" section closing todo_guide.md
+_TODO_GUIDE_INSTRUCTIONS = """\
+## How to Complete TODOs
+
+### Specify Columns
+
+When you see `SELECT *` with a TODO comment, replace it with explicit columns:
+
+```sql
+-- Before:
+select *
+/* TODO: specify columns */
+from {{ ref('stg_source') }}
+
+-- After:
+select
+    "column_1",
+    "column_2",
+    "column_3"
+from {{ ref('stg_source') }}
+```
+
+### Implement Transformation
+
+When you see a TODO to implement transformation logic, review the original Alteryx workflow
+and translate the logic to Trino SQL:
+
+```sql
+-- Before:
+-- TODO: Implement CustomTool transformation
+select * from source
+
+-- After:
+select
+    "id",
+    upper("name") as "name_upper",
+    case when "status" = 1 then 'Active' else 'Inactive' end as "status_text"
+from source
+```
+
+---
+
+[Back to Index](index.md)"""
 
 
 class DocumentationGenerator:
@@ -26,6 +92,9 @@ class DocumentationGenerator:
         # Create subdirectories
         (self.output_dir / "workflows").mkdir(exist_ok=True)
 
+        self._pending_writes: Dict[Path, bytes] = {}  # path -> encoded content (flushed in batch)
+        self._analyzers: Dict[int, TransformationAnalyzer] = {}  # id(workflow) -> analyzer
+
     def generate_all(self, workflows: List[AlteryxWorkflow],
                      macro_inventory: Optional[MacroInventory] = None,
                      dbt_todos: Optional[List] = None) -> None:
@@ -39,15 +108,22 @@ class DocumentationGenerator:
         # Generate index
         self._generate_index(workflows, macro_inventory, dbt_todos)
 
-        # Generate per-workflow docs
+        # Generate per-workflow docs, aggregating sources/targets in the same pass
+        sources_map: Dict[str, Dict] = {}
+        targets_map: Dict[str, Dict] = {}
         for workflow in workflows:
-            self._generate_workflow_doc(workflow)
+            analyzer = self._get_analyzer(workflow)
+            sources = analyzer.get_source_inventory()
+            targets = analyzer.get_target_inventory()
+            self._generate_workflow_doc(workflow, sources, targets)
+            self._add_to_inventory(sources_map, sources, workflow.metadata.name)
+            self._add_to_inventory(targets_map, targets, workflow.metadata.name)
 
         # Generate sources inventory
-        self._generate_sources_doc(workflows)
+        self._generate_sources_doc(sources_map)
 
         # Generate targets inventory
-        self._generate_targets_doc(workflows)
+        self._generate_targets_doc(targets_map)
 
         # Generate macros doc
         if macro_inventory:
@@ -60,315 +136,347 @@ class DocumentationGenerator:
         if dbt_todos:
             self._generate_todo_guide(dbt_todos)
 
+        # Write all queued pages to disk
+        self._flush_writes()
+
         print(f"Documentation generated at: {self.output_dir}")
 
+    def _get_analyzer(self, workflow: AlteryxWorkflow) -> TransformationAnalyzer:
+        """Return the shared TransformationAnalyzer for a workflow.
+
+        Each doc pass (workflow page, sources, targets, medallion mapping) asks
+        for the same inventories, so one analyzer per workflow is reused and
+        its results are computed only once. Keyed by id(); the cached analyzer
+        holds a reference to the workflow, so the id cannot be recycled.
+        """
+        analyzer = self._analyzers.get(id(workflow))
+        if analyzer is None:
+            analyzer = TransformationAnalyzer(workflow)
+            self._analyzers[id(workflow)] = analyzer
+        return analyzer
+
+    @staticmethod
+    def _add_to_inventory(inventory: Dict[str, Dict], items: List[Dict],
+                          workflow_name: str) -> None:
+        """Merge a workflow's source/target items into an inventory keyed by type and path."""
+        for item in items:
+            key = f"{item['type']}|{item['path']}"
+            entry = inventory.get(key)
+            if entry is None:
+                entry = inventory[key] = {
+                    'name': item['name'],
+                    'type': item['type'],
+                    'path': item['path'],
+                    'workflows': []
+                }
+            entry['workflows'].append(workflow_name)
+
+    @staticmethod
+    def _format_workflow_list(workflows: List[str]) -> str:
+        """Format a 'Used In' cell: the first three workflows plus a count of the rest."""
+        if len(workflows) > 3:
+            return f"{', '.join(workflows[:3])} (+{len(workflows) - 3})"
+        return ", ".join(workflows)
+
     def _generate_index(self, workflows: List[AlteryxWorkflow],
                         macro_inventory: Optional[MacroInventory],
                         dbt_todos: Optional[List] = None) -> None:
         """Generate the main index.md file."""
-        content = [
-            "# Alteryx to Starburst Migration Documentation",
-            "",
-            f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*",
-            "",
-            "**Target Platform**: Starburst (Trino-based) with dbt",
-            "",
-            "## Overview",
-            "",
-            f"- **Total Workflows**: {len(workflows)}",
-        ]
-
-        # Count totals
-        total_sources = sum(len(w.sources) for w in workflows)
-        total_targets = sum(len(w.targets) for w in workflows)
-        total_nodes = sum(len(w.nodes) for w in workflows)
-        total_macros = len(set(m for w in workflows for m in w.macros_used))
-
-        content.extend([
-            f"- **Total Data Sources**: {total_sources}",
-            f"- **Total Outputs**: {total_targets}",
-            f"- **Total Tools/Nodes**: {total_nodes}",
-            f"- **Unique Macros**: {total_macros}",
-            "",
-            "## Workflows",
-            "",
-            "| Workflow | Description | Sources | Outputs | Tools | Macros |",
-            "|----------|-------------|---------|---------|-------|--------|",
-        ])
+        buf = io.StringIO()
+        buf.write(
+            "# Alteryx to Starburst Migration Documentation\n"
+            "\n"
+            f"*Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
+            "\n"
+            "**Target Platform**: Starburst (Trino-based) with dbt\n"
+            "\n"
+            "## Overview\n"
+            "\n"
+            f"- **Total Workflows**: {len(workflows)}\n"
+        )
+
+        # Count totals in a single pass over the workflows
+        total_sources = total_targets = total_nodes = 0
+        unique_macros = set()
+        for w in workflows:
+            total_sources += len(w.sources)
+            total_targets += len(w.targets)
+            total_nodes += len(w.nodes)
+            unique_macros.update(w.macros_used)
+        total_macros = len(unique_macros)
+
+        buf.write(
+            f"- **Total Data Sources**: {total_sources}\n"
+            f"- **Total Outputs**: {total_targets}\n"
+            f"- **Total Tools/Nodes**: {total_nodes}\n"
+            f"- **Unique Macros**: {total_macros}\n"
+            "\n"
+            "## Workflows\n"
+            "\n"
+            "| Workflow | Description | Sources | Outputs | Tools | Macros |\n"
+            "|----------|-------------|---------|---------|-------|--------|\n"
+        )
 
         for wf in workflows:
-            desc = (wf.metadata.description or "")[:50]
-            if len(wf.metadata.description or "") > 50:
+            description = wf.metadata.description or ""
+            desc = description[:50]
+            if len(description) > 50:
                 desc += "..."
-            content.append(
+            buf.write(
                 f"| [{wf.metadata.name}](workflows/{wf.metadata.name}.md) "
                 f"| {desc} "
                 f"| {len(wf.sources)} "
                 f"| {len(wf.targets)} "
                 f"| {len(wf.nodes)} "
-                f"| {len(wf.macros_used)} |"
+                f"| {len(wf.macros_used)} |\n"
             )
 
-        content.extend([
-            "",
-            "## Quick Links",
-            "",
-            "- [All Data Sources](sources.md)",
-            "- [All Output Targets](targets.md)",
-            "- [Macro Inventory](macros.md)",
-            "- [Medallion Architecture Mapping](medallion_mapping.md)",
-        ])
+        buf.write(
+            "\n"
+            "## Quick Links\n"
+            "\n"
+            "- [All Data Sources](sources.md)\n"
+            "- [All Output Targets](targets.md)\n"
+            "- [Macro Inventory](macros.md)\n"
+            "- [Medallion Architecture Mapping](medallion_mapping.md)\n"
+        )
 
         # Add TODO guide link if there are TODOs
         if dbt_todos:
             high_priority = sum(1 for t in dbt_todos if t.priority == "high")
-            content.append(f"- [**Developer TODO Guide**](todo_guide.md) - {len(dbt_todos)} items ({high_priority} high priority)")
+            buf.write(f"- [**Developer TODO Guide**](todo_guide.md) - {len(dbt_todos)} items ({high_priority} high priority)\n")
 
-        content.extend([
-            "",
-            "---",
-            "",
-            "*This documentation was generated to assist with migrating Alteryx ETL workflows to Starburst (Trino) / dbt ELT architecture with medallion pattern.*",
-        ])
+        buf.write(
+            "\n"
+            "---\n"
+            "\n"
+            "*This documentation was generated to assist with migrating Alteryx ETL workflows to Starburst (Trino) / dbt ELT architecture with medallion pattern.*"
+        )
 
-        self._write_file(self.output_dir / "index.md", "\n".join(content))
+        self._write_file(self.output_dir / "index.md", buf.getvalue())
 
-    def _generate_workflow_doc(self, workflow: AlteryxWorkflow) -> None:
-        """Generate documentation for a single workflow."""
-        analyzer = TransformationAnalyzer(workflow)
+    def _generate_workflow_doc(self, workflow: AlteryxWorkflow,
+                               sources: List[Dict], targets: List[Dict]) -> None:
+        """Generate documentation for a single workflow.
 
-        content = [
-            f"# {workflow.metadata.name}",
-            "",
-        ]
+        Args:
+            workflow: The workflow to document
+            sources: Source inventory for the workflow
+            targets: Target inventory for the workflow
+        """
+        analyzer = self._get_analyzer(workflow)
+
+        buf = io.StringIO()
+        buf.write(f"# {workflow.metadata.name}\n\n")
 
         # Metadata
-        content.extend([
-            "## Overview",
-            "",
-            f"- **File**: `{workflow.metadata.file_path}`",
-        ])
+        buf.write(
+            "## Overview\n"
+            "\n"
+            f"- **File**: `{workflow.metadata.file_path}`\n"
+        )
 
         if workflow.metadata.alteryx_version:
-            content.append(f"- **Alteryx Version**: {workflow.metadata.alteryx_version}")
+            buf.write(f"- **Alteryx Version**: {workflow.metadata.alteryx_version}\n")
         if workflow.metadata.description:
-            content.append(f"- **Description**: {workflow.metadata.description}")
+            buf.write(f"- **Description**: {workflow.metadata.description}\n")
         if workflow.metadata.author:
-            content.append(f"- **Author**: {workflow.metadata.author}")
-
-        content.extend([
-            f"- **Total Tools**: {len(workflow.nodes)}",
-            f"- **Data Sources**: {len(workflow.sources)}",
-            f"- **Outputs**: {len(workflow.targets)}",
-            f"- **Macros Used**: {len(workflow.macros_used)}",
-            "",
-        ])
+            buf.write(f"- **Author**: {workflow.metadata.author}\n")
+
+        buf.write(
+            f"- **Total Tools**: {len(workflow.nodes)}\n"
+            f"- **Data Sources**: {len(workflow.sources)}\n"
+            f"- **Outputs**: {len(workflow.targets)}\n"
+            f"- **Macros Used**: {len(workflow.macros_used)}\n"
+            "\n"
+        )
 
         # Data Flow Diagram
-        content.extend([
-            "## Data Flow Diagram",
-            "",
-            "```mermaid",
-            self._generate_mermaid_diagram(workflow),
-            "```",
-            "",
-        ])
+        buf.write(
+            "## Data Flow Diagram\n"
+            "\n"
+            "```mermaid\n"
+        )
+        self._generate_mermaid_diagram(workflow, buf)
+        buf.write(
+            "```\n"
+            "\n"
+        )
 
         # Sources Table
-        content.extend([
-            "## Data Sources",
-            "",
-        ])
+        buf.write("## Data Sources\n\n")
 
-        sources = analyzer.get_source_inventory()
         if sources:
-            content.extend([
-                "| Source | Type | Path/Connection |",
-                "|--------|------|-----------------|",
-            ])
+            buf.write(
+                "| Source | Type | Path/Connection |\n"
+                "|--------|------|-----------------|\n"
+            )
             for src in sources:
                 path = src['path']
                 if src['connection']:
                     path = f"{src['connection']} / {path}"
-                content.append(f"| {src['name']} | {src['type']} | `{path}` |")
+                buf.write(f"| {src['name']} | {src['type']} | `{path}` |\n")
         else:
-            content.append("*No data sources found*")
+            buf.write("*No data sources found*\n")
 
-        content.append("")
+        buf.write("\n")
 
         # Targets Table
-        content.extend([
-            "## Output Targets",
-            "",
-        ])
+        buf.write("## Output Targets\n\n")
 
-        targets = analyzer.get_target_inventory()
         if targets:
-            content.extend([
-                "| Target | Type | Path/Connection |",
-                "|--------|------|-----------------|",
-            ])
+            buf.write(
+                "| Target | Type | Path/Connection |\n"
+                "|--------|------|-----------------|\n"
+            )
             for tgt in targets:
                 path = tgt['path']
                 if tgt['connection']:
                     path = f"{tgt['connection']} / {path}"
-                content.append(f"| {tgt['name']} | {tgt['type']} | `{path}` |")
+                buf.write(f"| {tgt['name']} | {tgt['type']} | `{path}` |\n")
         else:
-            content.append("*No output targets found*")
+            buf.write("*No output targets found*\n")
 
-        content.append("")
+        buf.write("\n")
 
         # Transformation Steps
-        content.extend([
-            "## Transformation Steps",
-            "",
-        ])
+        buf.write("## Transformation Steps\n\n")
 
         steps = analyzer.get_ordered_transformations()
         for step in steps:
-            content.append(f"{step.order}. **{step.tool_name}** (Tool #{step.tool_id})")
-            content.append(f"   - {step.description}")
-            if step.expression:
-                expr_preview = step.expression[:100]
-                if len(step.expression) > 100:
+            buf.write(
+                f"{step.order}. **{step.tool_name}** (Tool #{step.tool_id})\n"
+                f"   - {step.description}\n"
+            )
+            expression = step.expression
+            if expression:
+                expr_preview = expression[:100]
+                if len(expression) > 100:
                     expr_preview += "..."
-                content.append(f"   - Expression: `{expr_preview}`")
-            content.append("")
+                buf.write(f"   - Expression: `{expr_preview}`\n")
+            buf.write("\n")
 
         # Macros Used
         if workflow.macros_used:
-            content.extend([
-                "## Macros Used",
-                "",
-            ])
+            buf.write("## Macros Used\n\n")
+            missing = set(workflow.missing_macros)
             for macro in workflow.macros_used:
-                status = "Found" if macro not in workflow.missing_macros else "**MISSING**"
-                content.append(f"- `{macro}` - {status}")
+                status = "Found" if macro not in missing else "**MISSING**"
+                buf.write(f"- `{macro}` - {status}\n")
 
-            content.append("")
+            buf.write("\n")
 
         # Suggested DBT Structure
-        content.extend([
-            "## Suggested DBT Structure",
-            "",
-        ])
+        buf.write("## Suggested DBT Structure\n\n")
 
         medallion = analyzer.suggest_medallion_mapping()
 
         # Bronze Layer
-        bronze_nodes = medallion.get(MedallionLayer.BRONZE.value, [])
+        bronze_nodes = medallion.get(_BRONZE, [])
         if bronze_nodes:
-            content.append("### Bronze Layer (Staging)")
-            content.append("")
+            buf.write("### Bronze Layer (Staging)\n\n")
             for node in bronze_nodes:
                 model_name = self._suggest_model_name(node, MedallionLayer.BRONZE)
-                content.append(f"- `{model_name}` - {node.get_display_name()}")
-            content.append("")
+                buf.write(f"- `{model_name}` - {node.get_display_name()}\n")
+            buf.write("\n")
 
         # Silver Layer
-        silver_nodes = medallion.get(MedallionLayer.SILVER.value, [])
+        silver_nodes = medallion.get(_SILVER, [])
         if silver_nodes:
-            content.append("### Silver Layer (Intermediate)")
-            content.append("")
+            buf.write("### Silver Layer (Intermediate)\n\n")
             for node in silver_nodes[:10]:  # Limit to prevent huge lists
                 model_name = self._suggest_model_name(node, MedallionLayer.SILVER)
-                content.append(f"- `{model_name}` - {node.get_display_name()}")
+                buf.write(f"- `{model_name}` - {node.get_display_name()}\n")
             if len(silver_nodes) > 10:
-                content.append(f"- *...and {len(silver_nodes) - 10} more transformations*")
-            content.append("")
+                buf.write(f"- *...and {len(silver_nodes) - 10} more transformations*\n")
+            buf.write("\n")
 
         # Gold Layer
-        gold_nodes = medallion.get(MedallionLayer.GOLD.value, [])
+        gold_nodes = medallion.get(_GOLD, [])
         if gold_nodes:
-            content.append("### Gold Layer (Marts)")
-            content.append("")
+            buf.write("### Gold Layer (Marts)\n\n")
             for node in gold_nodes:
                 model_name = self._suggest_model_name(node, MedallionLayer.GOLD)
-                content.append(f"- `{model_name}` - {node.get_display_name()}")
-            content.append("")
+                buf.write(f"- `{model_name}` - {node.get_display_name()}\n")
+            buf.write("\n")
 
         # DBT SQL Hints
-        content.extend([
-            "## Trino SQL Translation Hints",
-            "",
-            "Key transformations with Trino SQL equivalents (for Starburst):",
-            "",
-        ])
+        buf.write(
+            "## Trino SQL Translation Hints\n"
+            "\n"
+            "Key transformations with Trino SQL equivalents (for Starburst):\n"
+            "\n"
+        )
 
         for step in steps:
             if step.dbt_hint and step.dbt_hint != "-- Custom logic required":
-                content.append(f"### Tool #{step.tool_id}: {step.tool_name}")
-                content.append("")
-                content.append("```sql")
-                content.append(step.dbt_hint)
-                content.append("```")
-                content.append("")
-
-        content.extend([
-            "---",
-            "",
-            f"[Back to Index](../index.md)",
-        ])
+                buf.write(
+                    f"### Tool #{step.tool_id}: {step.tool_name}\n"
+                    "\n"
+                    "```sql\n"
+                    f"{step.dbt_hint}\n"
+                    "```\n"
+                    "\n"
+                )
+
+        buf.write(
+            "---\n"
+            "\n"
+            "[Back to Index](../index.md)"
+        )
 
         self._write_file(
             self.output_dir / "workflows" / f"{workflow.metadata.name}.md",
-            "\n".join(content)
+            buf.getvalue()
         )
 
-    def _generate_mermaid_diagram(self, workflow: AlteryxWorkflow) -> str:
-        """Generate a Mermaid flowchart for the workflow."""
-        lines = ["graph LR"]
+    def _generate_mermaid_diagram(self, workflow: AlteryxWorkflow, buf: io.StringIO) -> None:
+        """Write a Mermaid flowchart for the workflow into buf, one line per statement."""
+        buf.write("graph LR\n")
 
-        # Track which nodes are in containers
+        # Index nodes and track which nodes are in containers, in one pass
+        by_id: Dict[int, AlteryxNode] = {}
         container_nodes = {}  # child_id -> container_id
         containers = []
+        plain_nodes = []
         for node in workflow.nodes:
+            by_id.setdefault(node.tool_id, node)  # first match, like get_node_by_id
             if node.category == ToolCategory.CONTAINER:
                 containers.append(node)
                 for child_id in node.child_tool_ids:
                     container_nodes[child_id] = node.tool_id
+            else:
+                plain_nodes.append(node)
 
         # Create subgraphs for containers
         for container in containers:
             label = container.annotation or container.plugin_name
             label = label.replace('"', "'")[:30]
-            lines.append(f'    subgraph C{container.tool_id}["{label}"]')
+            buf.write(f'    subgraph C{container.tool_id}["{label}"]\n')
 
             # Add child nodes to subgraph
             for child_id in container.child_tool_ids:
-                child = workflow.get_node_by_id(child_id)
+                child = by_id.get(child_id)
                 if child:
                     node_line = self._create_mermaid_node(child)
-                    lines.append(f'        {node_line}')
+                    buf.write(f'        {node_line}\n')
 
-            lines.append('    end')
+            buf.write('    end\n')
 
         # Create node definitions for non-container, non-child nodes
-        for node in workflow.nodes:
-            if node.category == ToolCategory.CONTAINER:
-                continue  # Already handled as subgraph
+        for node in plain_nodes:
             if node.tool_id in container_nodes:
                 continue  # Already added to container subgraph
 
             node_line = self._create_mermaid_node(node)
-            lines.append(f'    {node_line}')
+            buf.write(f'    {node_line}\n')
 
         # Create connections
         for conn in workflow.connections:
-            origin = f"N{conn.origin_id}"
-            dest = f"N{conn.destination_id}"
-
             # Add anchor info if not standard
-            label = ""
-            if conn.origin_anchor not in ["Output", "Output1"]:
-                label = conn.origin_anchor
-
-            if label:
-                lines.append(f'    {origin} -->|{label}| {dest}')
-            else:
-                lines.append(f'    {origin} --> {dest}')
-
-        return "\n".join(lines)
+            anchor = conn.origin_anchor
+            tag = f"|{anchor}|" if anchor and anchor not in _STD_ANCHORS else ""
+            buf.write(f'    N{conn.origin_id} -->{tag} N{conn.destination_id}\n')
 
     def _create_mermaid_node(self, node: AlteryxNode) -> str:
         """Create a Mermaid node definition."""
@@ -376,7 +484,7 @@ class DocumentationGenerator:
         label = node.get_display_name()
 
         # Escape special characters
-        label = label.replace('"', "'").replace("[", "(").replace("]", ")")
+        label = label.translate(_MERMAID_TRANS)
 
         # Truncate long labels
         if len(label) > 40:
@@ -392,201 +500,163 @@ class DocumentationGenerator:
         else:
             return f'{node_id}["{label}"]'
 
-    def _generate_sources_doc(self, workflows: List[AlteryxWorkflow]) -> None:
-        """Generate sources.md with all data sources."""
-        content = [
-            "# Data Sources Inventory",
-            "",
-            "Complete inventory of all data sources across workflows.",
-            "",
-            "| Source | Type | Path/Connection | Used In |",
-            "|--------|------|-----------------|---------|",
-        ]
-
-        # Collect all sources
-        sources_map: Dict[str, List[str]] = {}
-
-        for wf in workflows:
-            analyzer = TransformationAnalyzer(wf)
-            for src in analyzer.get_source_inventory():
-                key = f"{src['type']}|{src['path']}"
-                if key not in sources_map:
-                    sources_map[key] = {
-                        'name': src['name'],
-                        'type': src['type'],
-                        'path': src['path'],
-                        'workflows': []
-                    }
-                sources_map[key]['workflows'].append(wf.metadata.name)
+    def _generate_sources_doc(self, sources_map: Dict[str, Dict]) -> None:
+        """Generate sources.md from the sources aggregated across all workflows."""
+        buf = io.StringIO()
+        buf.write(
+            "# Data Sources Inventory\n"
+            "\n"
+            "Complete inventory of all data sources across workflows.\n"
+            "\n"
+            "| Source | Type | Path/Connection | Used In |\n"
+            "|--------|------|-----------------|---------|\n"
+        )
 
         for source in sources_map.values():
-            workflows_str = ", ".join(source['workflows'][:3])
-            if len(source['workflows']) > 3:
-                workflows_str += f" (+{len(source['workflows']) - 3})"
-            content.append(
-                f"| {source['name']} | {source['type']} | `{source['path']}` | {workflows_str} |"
+            buf.write(
+                f"| {source['name']} | {source['type']} | `{source['path']}` "
+                f"| {self._format_workflow_list(source['workflows'])} |\n"
             )
 
-        content.extend([
-            "",
-            f"**Total Unique Sources**: {len(sources_map)}",
-            "",
-            "---",
-            "",
-            "[Back to Index](index.md)",
-        ])
-
-        self._write_file(self.output_dir / "sources.md", "\n".join(content))
-
-    def _generate_targets_doc(self, workflows: List[AlteryxWorkflow]) -> None:
-        """Generate targets.md with all output targets."""
-        content = [
-            "# Output Targets Inventory",
-            "",
-            "Complete inventory of all output targets across workflows.",
-            "",
-            "| Target | Type | Path/Connection | Used In |",
-            "|--------|------|-----------------|---------|",
-        ]
-
-        # Collect all targets
-        targets_map: Dict[str, Dict] = {}
+        buf.write(
+            "\n"
+            f"**Total Unique Sources**: {len(sources_map)}\n"
+            "\n"
+            "---\n"
+            "\n"
+            "[Back to Index](index.md)"
+        )
 
-        for wf in workflows:
-            analyzer = TransformationAnalyzer(wf)
-            for tgt in analyzer.get_target_inventory():
-                key = f"{tgt['type']}|{tgt['path']}"
-                if key not in targets_map:
-                    targets_map[key] = {
-                        'name': tgt['name'],
-                        'type': tgt['type'],
-                        'path': tgt['path'],
-                        'workflows': []
-                    }
-                targets_map[key]['workflows'].append(wf.metadata.name)
+        self._write_file(self.output_dir / "sources.md", buf.getvalue())
+
+    def _generate_targets_doc(self, targets_map: Dict[str, Dict]) -> None:
+        """Generate targets.md from the targets aggregated across all workflows."""
+        buf = io.StringIO()
+        buf.write(
+            "# Output Targets Inventory\n"
+            "\n"
+            "Complete inventory of all output targets across workflows.\n"
+            "\n"
+            "| Target | Type | Path/Connection | Used In |\n"
+            "|--------|------|-----------------|---------|\n"
+        )
 
         for target in targets_map.values():
-            workflows_str = ", ".join(target['workflows'][:3])
-            if len(target['workflows']) > 3:
-                workflows_str += f" (+{len(target['workflows']) - 3})"
-            content.append(
-                f"| {target['name']} | {target['type']} | `{target['path']}` | {workflows_str} |"
+            buf.write(
+                f"| {target['name']} | {target['type']} | `{target['path']}` "
+                f"| {self._format_workflow_list(target['workflows'])} |\n"
             )
 
-        content.extend([
-            "",
-            f"**Total Unique Targets**: {len(targets_map)}",
-            "",
-            "---",
-            "",
-            "[Back to Index](index.md)",
-        ])
+        buf.write(
+            "\n"
+            f"**Total Unique Targets**: {len(targets_map)}\n"
+            "\n"
+            "---\n"
+            "\n"
+            "[Back to Index](index.md)"
+        )
 
-        self._write_file(self.output_dir / "targets.md", "\n".join(content))
+        self._write_file(self.output_dir / "targets.md", buf.getvalue())
 
     def _generate_macros_doc(self, macro_inventory: MacroInventory) -> None:
         """Generate macros.md with macro inventory."""
-        content = [
-            "# Macro Inventory",
-            "",
-        ]
+        buf = io.StringIO()
+        buf.write("# Macro Inventory\n\n")
 
         summary = macro_inventory.get_summary()
-        content.extend([
-            "## Summary",
-            "",
-            f"- **Total Macros**: {summary['total_macros']}",
-            f"- **Found**: {summary['found']}",
-            f"- **Missing**: {summary['missing']}",
-            f"- **Shared (used by multiple workflows)**: {summary['shared']}",
-            "",
-        ])
+        buf.write(
+            "## Summary\n"
+            "\n"
+            f"- **Total Macros**: {summary['total_macros']}\n"
+            f"- **Found**: {summary['found']}\n"
+            f"- **Missing**: {summary['missing']}\n"
+            f"- **Shared (used by multiple workflows)**: {summary['shared']}\n"
+            "\n"
+        )
 
         # Missing macros (highlight these)
         missing = macro_inventory.get_missing_macros()
         if missing:
-            content.extend([
-                "## Missing Macros",
-                "",
-                "These macros could not be found and need to be located:",
-                "",
-            ])
+            buf.write(
+                "## Missing Macros\n"
+                "\n"
+                "These macros could not be found and need to be located:\n"
+                "\n"
+            )
             for macro in missing:
                 workflows = macro_inventory.usage.get(macro.name, [])
-                content.append(f"- **{macro.name}**")
-                content.append(f"  - Original path: `{macro.file_path}`")
-                content.append(f"  - Used in: {', '.join(workflows)}")
-                content.append("")
+                buf.write(
+                    f"- **{macro.name}**\n"
+                    f"  - Original path: `{macro.file_path}`\n"
+                    f"  - Used in: {', '.join(workflows)}\n"
+                    "\n"
+                )
 
         # Found macros
         found_macros = [m for m in macro_inventory.macros.values() if m.found]
         if found_macros:
-            content.extend([
-                "## Found Macros",
-                "",
-                "| Macro | Path | Inputs | Outputs | Used In |",
-                "|-------|------|--------|---------|---------|",
-            ])
+            buf.write(
+                "## Found Macros\n"
+                "\n"
+                "| Macro | Path | Inputs | Outputs | Used In |\n"
+                "|-------|------|--------|---------|---------|\n"
+            )
 
             for macro in found_macros:
                 workflows = macro_inventory.usage.get(macro.name, [])
-                inputs = len(macro.inputs)
-                outputs = len(macro.outputs)
-                workflows_str = ", ".join(workflows[:3])
-                if len(workflows) > 3:
-                    workflows_str += f" (+{len(workflows) - 3})"
-
-                content.append(
-                    f"| {macro.name} | `{macro.resolved_path}` | {inputs} | {outputs} | {workflows_str} |"
+                buf.write(
+                    f"| {macro.name} | `{macro.resolved_path}` | {len(macro.inputs)} "
+                    f"| {len(macro.outputs)} | {self._format_workflow_list(workflows)} |\n"
                 )
 
-            content.append("")
+            buf.write("\n")
 
         # Shared macros
         shared = macro_inventory.get_shared_macros()
         if shared:
-            content.extend([
-                "## Shared Macros",
-                "",
-                "Macros used by multiple workflows (candidates for DBT macros):",
-                "",
-            ])
+            buf.write(
+                "## Shared Macros\n"
+                "\n"
+                "Macros used by multiple workflows (candidates for DBT macros):\n"
+                "\n"
+            )
             for macro in shared:
                 workflows = macro_inventory.usage.get(macro.name, [])
-                content.append(f"- **{macro.name}** - used by {len(workflows)} workflows")
+                buf.write(f"- **{macro.name}** - used by {len(workflows)} workflows\n")
                 for wf in workflows[:5]:
-                    content.append(f"  - {wf}")
+                    buf.write(f"  - {wf}\n")
                 if len(workflows) > 5:
-                    content.append(f"  - *...and {len(workflows) - 5} more*")
-                content.append("")
+                    buf.write(f"  - *...and {len(workflows) - 5} more*\n")
+                buf.write("\n")
 
-        content.extend([
-            "---",
-            "",
-            "[Back to Index](index.md)",
-        ])
+        buf.write(
+            "---\n"
+            "\n"
+            "[Back to Index](index.md)"
+        )
 
-        self._write_file(self.output_dir / "macros.md", "\n".join(content))
+        self._write_file(self.output_dir / "macros.md", buf.getvalue())
 
     def _generate_medallion_mapping(self, workflows: List[AlteryxWorkflow]) -> None:
         """Generate medallion_mapping.md with layer suggestions."""
-        content = [
-            "# Medallion Architecture Mapping",
-            "",
-            "Suggested DBT model organization following the medallion pattern.",
-            "",
-            "## Architecture Overview",
-            "",
-            "```",
-            "Bronze (Staging)     Silver (Intermediate)     Gold (Marts)",
-            "----------------     --------------------     ------------",
-            "stg_*                int_*                    fct_* / dim_*",
-            "                                              ",
-            "Raw data from        Cleaned, joined,         Business-ready",
-            "sources              transformed data         aggregations",
-            "```",
-            "",
-        ]
+        buf = io.StringIO()
+        buf.write(
+            "# Medallion Architecture Mapping\n"
+            "\n"
+            "Suggested DBT model organization following the medallion pattern.\n"
+            "\n"
+            "## Architecture Overview\n"
+            "\n"
+            "```\n"
+            "Bronze (Staging)     Silver (Intermediate)     Gold (Marts)\n"
+            "----------------     --------------------     ------------\n"
+            "stg_*                int_*                    fct_* / dim_*\n"
+            "                                              \n"
+            "Raw data from        Cleaned, joined,         Business-ready\n"
+            "sources              transformed data         aggregations\n"
+            "```\n"
+            "\n"
+        )
 
         # Collect all unique sources for bronze
         bronze_sources = set()
@@ -594,101 +664,99 @@ class DocumentationGenerator:
         gold_outputs = []
 
         for wf in workflows:
-            analyzer = TransformationAnalyzer(wf)
+            analyzer = self._get_analyzer(wf)
             medallion = analyzer.suggest_medallion_mapping()
+            wf_name = wf.metadata.name
 
-            for node in medallion.get(MedallionLayer.BRONZE.value, []):
+            for node in medallion.get(_BRONZE, []):
                 if node.source_path or node.table_name:
                     source_name = node.table_name or Path(node.source_path or "unknown").stem
-                    bronze_sources.add((source_name, node.get_display_name(), wf.metadata.name))
+                    bronze_sources.add((source_name, node.get_display_name(), wf_name))
 
-            for node in medallion.get(MedallionLayer.SILVER.value, []):
-                silver_transforms.append((node, wf.metadata.name))
+            for node in medallion.get(_SILVER, []):
+                silver_transforms.append((node, wf_name))
 
-            for node in medallion.get(MedallionLayer.GOLD.value, []):
-                gold_outputs.append((node, wf.metadata.name))
+            for node in medallion.get(_GOLD, []):
+                gold_outputs.append((node, wf_name))
 
         # Bronze Layer
-        content.extend([
-            "## Bronze Layer (Staging Models)",
-            "",
-            "Create staging models for each data source:",
-            "",
-            "| Suggested Model | Source | Workflow |",
-            "|-----------------|--------|----------|",
-        ])
+        buf.write(
+            "## Bronze Layer (Staging Models)\n"
+            "\n"
+            "Create staging models for each data source:\n"
+            "\n"
+            "| Suggested Model | Source | Workflow |\n"
+            "|-----------------|--------|----------|\n"
+        )
 
         for source_name, display_name, wf_name in sorted(bronze_sources):
             model_name = f"stg_{self._sanitize_name(source_name)}"
-            content.append(f"| `{model_name}` | {display_name} | {wf_name} |")
+            buf.write(f"| `{model_name}` | {display_name} | {wf_name} |\n")
 
-        content.append("")
+        buf.write("\n")
 
         # Silver Layer
-        content.extend([
-            "## Silver Layer (Intermediate Models)",
-            "",
-            "Key transformations to implement as intermediate models:",
-            "",
-        ])
+        buf.write(
+            "## Silver Layer (Intermediate Models)\n"
+            "\n"
+            "Key transformations to implement as intermediate models:\n"
+            "\n"
+        )
 
         # Group by transformation type
-        transform_types = {}
+        transform_types: Dict[str, List] = defaultdict(list)
         for node, wf_name in silver_transforms:
-            key = node.plugin_name
-            if key not in transform_types:
-                transform_types[key] = []
-            transform_types[key].append((node, wf_name))
+            transform_types[node.plugin_name].append((node, wf_name))
 
         for transform_type, nodes in transform_types.items():
-            content.append(f"### {transform_type} Operations")
-            content.append("")
+            buf.write(f"### {transform_type} Operations\n\n")
             for node, wf_name in nodes[:5]:
                 model_name = f"int_{self._sanitize_name(node.get_display_name())}"
-                content.append(f"- `{model_name}` ({wf_name})")
+                buf.write(f"- `{model_name}` ({wf_name})\n")
             if len(nodes) > 5:
-                content.append(f"- *...and {len(nodes) - 5} more*")
-            content.append("")
+                buf.write(f"- *...and {len(nodes) - 5} more*\n")
+            buf.write("\n")
 
         # Gold Layer
-        content.extend([
-            "## Gold Layer (Marts)",
-            "",
-            "Final output models:",
-            "",
-            "| Suggested Model | Output | Workflow |",
-            "|-----------------|--------|----------|",
-        ])
+        buf.write(
+            "## Gold Layer (Marts)\n"
+            "\n"
+            "Final output models:\n"
+            "\n"
+            "| Suggested Model | Output | Workflow |\n"
+            "|-----------------|--------|----------|\n"
+        )
 
         for node, wf_name in gold_outputs:
             prefix = "fct_" if node.plugin_name == "Summarize" else "dim_"
-            model_name = f"{prefix}{self._sanitize_name(node.get_display_name())}"
-            content.append(f"| `{model_name}` | {node.get_display_name()} | {wf_name} |")
-
-        content.extend([
-            "",
-            "## Recommended DBT Project Structure",
-            "",
-            "```",
-            "models/",
-            "├── staging/           # Bronze layer",
-            "│   ├── _staging.yml   # Source definitions",
-            "│   └── stg_*.sql",
-            "├── intermediate/      # Silver layer",
-            "│   └── int_*.sql",
-            "└── marts/             # Gold layer",
-            "    ├── core/",
-            "    │   └── fct_*.sql",
-            "    └── dimensions/",
-            "        └── dim_*.sql",
-            "```",
-            "",
-            "---",
-            "",
-            "[Back to Index](index.md)",
-        ])
-
-        self._write_file(self.output_dir / "medallion_mapping.md", "\n".join(content))
+            display_name = node.get_display_name()
+            model_name = f"{prefix}{self._sanitize_name(display_name)}"
+            buf.write(f"| `{model_name}` | {display_name} | {wf_name} |\n")
+
+        buf.write(
+            "\n"
+            "## Recommended DBT Project Structure\n"
+            "\n"
+            "```\n"
+            "models/\n"
+            "├── staging/           # Bronze layer\n"
+            "│   ├── _staging.yml   # Source definitions\n"
+            "│   └── stg_*.sql\n"
+            "├── intermediate/      # Silver layer\n"
+            "│   └── int_*.sql\n"
+            "└── marts/             # Gold layer\n"
+            "    ├── core/\n"
+            "    │   └── fct_*.sql\n"
+            "    └── dimensions/\n"
+            "        └── dim_*.sql\n"
+            "```\n"
+            "\n"
+            "---\n"
+            "\n"
+            "[Back to Index](index.md)"
+        )
+
+        self._write_file(self.output_dir / "medallion_mapping.md", buf.getvalue())
 
     def _suggest_model_name(self, node: AlteryxNode, layer: MedallionLayer) -> str:
         """Suggest a DBT model name for a node."""
@@ -711,74 +779,64 @@ class DocumentationGenerator:
 
     def _sanitize_name(self, name: str) -> str:
         """Sanitize a name for use as a DBT model name."""
-        import re
-        # Remove special characters, replace spaces with underscores
-        sanitized = re.sub(r'[^a-zA-Z0-9_]', '_', name)
-        # Remove consecutive underscores
-        sanitized = re.sub(r'_+', '_', sanitized)
-        # Remove leading/trailing underscores
-        sanitized = sanitized.strip('_')
-        # Lowercase
-        sanitized = sanitized.lower()
-        # Truncate if too long
-        if len(sanitized) > 50:
-            sanitized = sanitized[:50]
-
-        return sanitized or "unknown"
+        if len(name) <= 50 and _RE_CLEAN_NAME.fullmatch(name):
+            return name
+        # Replace special characters with underscores, collapse runs of underscores
+        sanitized = _RE_SANITIZE.sub('_', name)
+        if '__' in sanitized:
+            sanitized = _RE_MULTI_UNDERSCORE.sub('_', sanitized)
+        # Strip leading/trailing underscores, lowercase, truncate if too long
+        return sanitized.strip('_').lower()[:50] or "unknown"
 
     def _generate_todo_guide(self, todos: List) -> None:
         """Generate todo_guide.md with all TODO items from DBT scaffold."""
-        content = [
-            "# Developer TODO Guide",
-            "",
-            "This guide lists all TODO items that need to be addressed in the generated DBT scaffold.",
-            "Complete these items to finalize the migration from Alteryx to DBT/Starburst.",
-            "",
-        ]
+        buf = io.StringIO()
+        buf.write(
+            "# Developer TODO Guide\n"
+            "\n"
+            "This guide lists all TODO items that need to be addressed in the generated DBT scaffold.\n"
+            "Complete these items to finalize the migration from Alteryx to DBT/Starburst.\n"
+            "\n"
+        )
+
+        # Bucket TODOs by priority, layer and type in a single pass
+        by_priority: Dict[str, List] = defaultdict(list)
+        by_layer: Dict[str, List] = defaultdict(list)
+        by_type: Dict[str, List] = defaultdict(list)
+        for todo in todos:
+            by_priority[todo.priority].append(todo)
+            by_layer[todo.layer].append(todo)
+            by_type[todo.todo_type].append(todo)
 
         # Summary
+        high_items = by_priority["high"]
         total = len(todos)
-        high = sum(1 for t in todos if t.priority == "high")
-        medium = sum(1 for t in todos if t.priority == "medium")
-        low = sum(1 for t in todos if t.priority == "low")
-
-        content.extend([
-            "## Summary",
-            "",
-            f"- **Total TODOs**: {total}",
-            f"- **High Priority**: {high}",
-            f"- **Medium Priority**: {medium}",
-            f"- **Low Priority**: {low}",
-            "",
-        ])
-
-        # By layer breakdown
-        by_layer = {}
-        for todo in todos:
-            layer = todo.layer
-            if layer not in by_layer:
-                by_layer[layer] = []
-            by_layer[layer].append(todo)
-
-        content.extend([
-            "## Progress Tracker",
-            "",
-            "Use this checklist to track your progress:",
-            "",
-        ])
+        high = len(high_items)
+        medium = len(by_priority["medium"])
+        low = len(by_priority["low"])
+
+        buf.write(
+            "## Summary\n"
+            "\n"
+            f"- **Total TODOs**: {total}\n"
+            f"- **High Priority**: {high}\n"
+            f"- **Medium Priority**: {medium}\n"
+            f"- **Low Priority**: {low}\n"
+            "\n"
+        )
 
-        # By type breakdown
-        by_type = {}
-        for todo in todos:
-            todo_type = todo.todo_type
-            if todo_type not in by_type:
-                by_type[todo_type] = []
-            by_type[todo_type].append(todo)
+        buf.write(
+            "## Progress Tracker\n"
+            "\n"
+            "Use this checklist to track your progress:\n"
+            "\n"
+        )
 
-        content.extend([
-            "| Type | Count | Description |",
-            "|------|-------|-------------|",
-        ])
+        # By type breakdown
+        buf.write(
+            "| Type | Count | Description |\n"
+            "|------|-------|-------------|\n"
+        )
 
         type_descriptions = {
             "specify_columns": "Replace SELECT * with explicit column lists",
@@ -788,39 +846,39 @@ class DocumentationGenerator:
 
         for todo_type, items in sorted(by_type.items()):
             desc = type_descriptions.get(todo_type, todo_type.replace("_", " ").title())
-            content.append(f"| {todo_type} | {len(items)} | {desc} |")
+            buf.write(f"| {todo_type} | {len(items)} | {desc} |\n")
 
-        content.append("")
+        buf.write("\n")
 
         # High priority items first
         if high > 0:
-            content.extend([
-                "## High Priority Items",
-                "",
-                "These items should be addressed first as they may cause errors or incorrect results.",
-                "",
-            ])
-
-            for i, todo in enumerate([t for t in todos if t.priority == "high"], 1):
-                content.extend([
-                    f"### {i}. {todo.description}",
-                    "",
-                    f"- **File**: `{todo.file_path}`",
-                    f"- **Model**: `{todo.model_name}`",
-                    f"- **Layer**: {todo.layer}",
-                    f"- **Type**: {todo.todo_type}",
-                ])
+            buf.write(
+                "## High Priority Items\n"
+                "\n"
+                "These items should be addressed first as they may cause errors or incorrect results.\n"
+                "\n"
+            )
+
+            for i, todo in enumerate(high_items, 1):
+                buf.write(
+                    f"### {i}. {todo.description}\n"
+                    "\n"
+                    f"- **File**: `{todo.file_path}`\n"
+                    f"- **Model**: `{todo.model_name}`\n"
+                    f"- **Layer**: {todo.layer}\n"
+                    f"- **Type**: {todo.todo_type}\n"
+                )
                 if todo.context:
-                    content.append(f"- **Context**: {todo.context}")
-                content.append("")
+                    buf.write(f"- **Context**: {todo.context}\n")
+                buf.write("\n")
 
         # Layer-by-layer guide
-        content.extend([
-            "## Layer-by-Layer Guide",
-            "",
-            "Work through the TODO items layer by layer, starting with Bronze (closest to source data).",
-            "",
-        ])
+        buf.write(
+            "## Layer-by-Layer Guide\n"
+            "\n"
+            "Work through the TODO items layer by layer, starting with Bronze (closest to source data).\n"
+            "\n"
+        )
 
         layer_order = ["bronze", "silver", "gold", "macro"]
         layer_names = {
@@ -833,81 +891,43 @@ class DocumentationGenerator:
         for layer in layer_order:
             if layer in by_layer:
                 items = by_layer[layer]
-                content.extend([
-                    f"### {layer_names.get(layer, layer.title())}",
-                    "",
-                    f"**{len(items)} items to complete:**",
-                    "",
-                ])
+                buf.write(
+                    f"### {layer_names.get(layer, layer.title())}\n"
+                    "\n"
+                    f"**{len(items)} items to complete:**\n"
+                    "\n"
+                )
 
                 # Group by model
-                by_model = {}
+                by_model: Dict[str, List] = defaultdict(list)
                 for todo in items:
-                    model = todo.model_name
-                    if model not in by_model:
-                        by_model[model] = []
-                    by_model[model].append(todo)
-
-                for model, model_todos in sorted(by_model.items()):
-                    file_path = model_todos[0].file_path if model_todos else ""
-                    content.append(f"#### `{model}`")
-                    content.append(f"File: `{file_path}`")
-                    content.append("")
+                    by_model[todo.model_name].append(todo)
+
+                for model in sorted(by_model):
+                    model_todos = by_model[model]
+                    file_path = model_todos[0].file_path
+                    buf.write(
+                        f"#### `{model}`\n"
+                        f"File: `{file_path}`\n"
+                        "\n"
+                    )
                     for todo in model_todos:
                         priority_marker = "[!]" if todo.priority == "high" else "[ ]"
-                        content.append(f"- {priority_marker} {todo.description}")
+                        buf.write(f"- {priority_marker} {todo.description}\n")
                         if todo.context:
-                            content.append(f"  - Context: {todo.context}")
-                    content.append("")
+                            buf.write(f"  - Context: {todo.context}\n")
+                    buf.write("\n")
 
         # Instructions
-        content.extend([
-            "## How to Complete TODOs",
-            "",
-            "### Specify Columns",
-            "",
-            "When you see `SELECT *` with a TODO comment, replace it with explicit columns:",
-            "",
-            "```sql",
-            "-- Before:",
-            "select *",
-            "/* TODO: specify columns */",
-            "from {{ ref('stg_source') }}",
-            "",
-            "-- After:",
-            "select",
-            '    "column_1",',
-            '    "column_2",',
-            '    "column_3"',
-            "from {{ ref('stg_source') }}",
-            "```",
-            "",
-            "### Implement Transformation",
-            "",
-            "When you see a TODO to implement transformation logic, review the original Alteryx workflow",
-            "and translate the logic to Trino SQL:",
-            "",
-            "```sql",
-            "-- Before:",
-            "-- TODO: Implement CustomTool transformation",
-            "select * from source",
-            "",
-            "-- After:",
-            "select",
-            '    "id",',
-            '    upper("name") as "name_upper",',
-            '    case when "status" = 1 then \'Active\' else \'Inactive\' end as "status_text"',
-            "from source",
-            "```",
-            "",
-            "---",
-            "",
-            "[Back to Index](index.md)",
-        ])
-
-        self._write_file(self.output_dir / "todo_guide.md", "\n".join(content))
+        buf.write(_TODO_GUIDE_INSTRUCTIONS)
+
+        self._write_file(self.output_dir / "todo_guide.md", buf.getvalue())
 
     def _write_file(self, path: Path, content: str) -> None:
-        """Write content to a file."""
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        """Queue content to be written to a file on the next flush."""
+        self._pending_writes[path] = content.encode('utf-8')
+
+    def _flush_writes(self) -> None:
+        """Write all queued pages."""
+        write_files_concurrently(self._pending_writes.items())
+        self._pending_writes.clear()
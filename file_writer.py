@@ -0,0 +1,41 @@
+"""
+Batched file writing shared by the documentation, DBT and validation generators.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, Optional, Tuple
+
+# Worker threads used to overlap file writes
+WRITE_WORKERS = 8
+
+# Below this many files, a thread pool costs more than it saves
+MIN_PARALLEL_WRITES = 8
+
+
+def _write_if_changed(item: Tuple[Path, bytes]) -> None:
+    """Write data to path, leaving identical files untouched so re-runs don't bump mtimes."""
+    path, data = item
+    if path.is_file() and path.stat().st_size == len(data) and path.read_bytes() == data:
+        return
+    path.write_bytes(data)
+
+
+def write_files_concurrently(items: Iterable[Tuple[Path, bytes]],
+                             min_parallel: Optional[int] = MIN_PARALLEL_WRITES) -> None:
+    """Write (path, data) pairs, creating parent directories as needed.
+
+    Batches of at least min_parallel files are written on WRITE_WORKERS threads;
+    smaller batches, or any batch when min_parallel is None, are written in order.
+    """
+    items = list(items)
+    for directory in {path.parent for path, _ in items}:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    if min_parallel is None or len(items) < min_parallel:
+        for item in items:
+            _write_if_changed(item)
+        return
+
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as executor:
+        # Consume the iterator so worker exceptions are raised here
+        list(executor.map(_write_if_changed, items))
@@ -8,6 +8,8 @@ Target Platform: Starburst (Trino-based)
 SQL Dialect: Trino SQL
 """
 import re
+import string
+import threading
 from typing import Dict, Tuple, Optional, Callable
 
 
@@ -226,16 +228,132 @@ ALTERYX_DATE_FORMAT_MAP = {
     '%Z': '%Z',      # Timezone name
 }
 
+# Any Alteryx date format specifier in ALTERYX_DATE_FORMAT_MAP
+_DATE_FORMAT_RE = re.compile('|'.join(re.escape(spec) for spec in ALTERYX_DATE_FORMAT_MAP))
+
+# Characters significant to argument splitting
+_ARG_TOKEN_RE = re.compile(r'[\'"(),]')
+
+# A call to any mapped function (e.g. "Trim(" or "datetimeadd (", name captured).
+# Longest names first so e.g. DateTimeDayOfWeek is preferred over a shorter prefix.
+_FUNC_CALL_PATTERN = r'\b(' + '|'.join(
+    re.escape(name) for name in sorted(ALTERYX_TO_TRINO_FUNCTIONS, key=len, reverse=True)
+) + r')\s*\('
+
+# Prefilter: expressions with no function call at all skip call scanning
+_FUNC_CALL_RE = re.compile(_FUNC_CALL_PATTERN, re.IGNORECASE)
+
+# Tokens significant to call scanning: a function call, a quote, or a parenthesis
+_CALL_TOKEN_RE = re.compile(_FUNC_CALL_PATTERN + r'|["\'()]', re.IGNORECASE)
+
+# Alteryx operators and their Trino equivalents, replaced in a single pass.
+# '!==' comes first so it still becomes '<>', as with the former chain of str.replace calls.
+_OPERATOR_MAP = {
+    '!==': '<>',
+    '==': '=',
+    '&&': ' AND ',
+    '||': ' OR ',
+    '!=': '<>',
+    '!': ' NOT ',
+}
+# Field references [FieldName] are matched in the same pass, so operator
+# characters inside a field name are left alone.
+_OPERATOR_RE = re.compile(
+    r'\[([^\]]+)\]|' + '|'.join(re.escape(op) for op in _OPERATOR_MAP)
+)
+
+
+def _replace_operator(match: re.Match) -> str:
+    """Rewrite one field reference or operator matched by _OPERATOR_RE."""
+    field = match.group(1)
+    if field is not None:
+        return '"' + field + '"'
+    return _OPERATOR_MAP[match.group(0)]
+
+
+def _template_arg_count(template: str) -> int:
+    """Return how many positional arguments a '{0}'-style template needs.
+
+    Templates are parsed once at import, so a call with too few arguments is
+    detected by a length check instead of str.format raising IndexError.
+    """
+    needed = 0
+    for _, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if field_name is None:
+            continue
+        if not field_name.isdigit() or format_spec or conversion:
+            raise ValueError(f"Unsupported placeholder in function template: {template!r}")
+        needed = max(needed, int(field_name) + 1)
+    return needed
+
+
+# Argument count required by each function whose Trino template uses placeholders
+_TEMPLATE_ARG_COUNTS: Dict[str, int] = {
+    name: _template_arg_count(template)
+    for name, (template, _) in ALTERYX_TO_TRINO_FUNCTIONS.items()
+    if template is not None and '{' in template
+}
+
+
+def _make_rewriter(template: Optional[str], expected_args: int,
+                   placeholder_args: Optional[int]) -> Optional[Callable[[list], str]]:
+    """Build the function that renders a call from its converted arguments.
+
+    The choice between a constant, a placeholder template and a renamed call is
+    made once here rather than on every conversion. Returns None for functions
+    that need special handling.
+    """
+    if template is None:
+        return None
+    if expected_args == 0:
+        # Zero-arg function
+        return lambda args: template
+    if expected_args != -1 and placeholder_args is not None:
+        # Template with placeholders (argument count is checked by the caller)
+        fmt = template.format
+        return lambda args: fmt(*args)
+    # Variable args or simple function name mapping
+    prefix = template + '('
+    return lambda args: prefix + ', '.join(args) + ')'
+
+
+# Case-insensitive dispatch table: casefolded name -> (canonical name, call
+# rewriter or None for special functions, expected args, args needed by
+# placeholders or None)
+_FUNC_DISPATCH: Dict[str, Tuple[str, Optional[Callable[[list], str]], int, Optional[int]]] = {
+    name.casefold(): (
+        name,
+        _make_rewriter(template, expected_args, _TEMPLATE_ARG_COUNTS.get(name)),
+        expected_args,
+        _TEMPLATE_ARG_COUNTS.get(name),
+    )
+    for name, (template, expected_args) in ALTERYX_TO_TRINO_FUNCTIONS.items()
+}
+
+# Constant parts of notes and TODO markers built on failure paths
+_NO_MAPPING_NOTE = "No mapping for Alteryx function: "
+_TODO_FIX_PREFIX = "/* TODO: Fix "
+_TODO_CONVERT_PREFIX = "/* TODO: Convert "
+
+# Converted expressions shared by all converters: expr -> (sql, conversion notes).
+# Conversion depends only on the expression, and formulas repeat across tools/workflows.
+_CONVERT_CACHE: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+_CONVERT_CACHE_SIZE = 4096
+_CONVERT_CACHE_LOCK = threading.Lock()  # Guards eviction/insertion across threads
+
 
 class FormulaConverter:
     """Converts Alteryx formulas to Trino SQL."""
 
+    # Only the notes are per instance; conversion reads the module-level tables.
+    # function_map/date_format_map stay as read-only class attributes for callers.
+    __slots__ = ('_conversion_notes',)
+
+    function_map = ALTERYX_TO_TRINO_FUNCTIONS
+    date_format_map = ALTERYX_DATE_FORMAT_MAP
+
     def __init__(self):
-        self.function_map = ALTERYX_TO_TRINO_FUNCTIONS
-        self.date_format_map = ALTERYX_DATE_FORMAT_MAP
         self._conversion_notes: list = []
-        # Create case-insensitive lookup for function names
-        self._func_name_map = {k.lower(): k for k in self.function_map}
 
     def convert(self, expr: str) -> str:
         """
@@ -250,134 +368,137 @@ class FormulaConverter:
         if not expr:
             return "NULL"
 
+        cached = _CONVERT_CACHE.get(expr)
+        if cached is not None:
+            sql, notes = cached
+            self._conversion_notes = list(notes)
+            return sql
+
+        sql = self._convert_uncached(expr)
+
+        with _CONVERT_CACHE_LOCK:
+            if len(_CONVERT_CACHE) >= _CONVERT_CACHE_SIZE:
+                # Evict the oldest entry
+                del _CONVERT_CACHE[next(iter(_CONVERT_CACHE))]
+            _CONVERT_CACHE[expr] = (sql, tuple(self._conversion_notes))
+        return sql
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Discard all cached conversions (e.g. after changing the function mappings)."""
+        with _CONVERT_CACHE_LOCK:
+            _CONVERT_CACHE.clear()
+
+    def _convert_uncached(self, expr: str) -> str:
+        """Convert a non-empty expression, recording notes in _conversion_notes."""
         self._conversion_notes = []
         sql = expr.strip()
 
-        # Replace Alteryx field references [FieldName] with "FieldName"
-        sql = re.sub(r'\[([^\]]+)\]', r'"\1"', sql)
-
-        # Replace operators
-        sql = sql.replace('==', '=')
-        sql = sql.replace('&&', ' AND ')
-        sql = sql.replace('||', ' OR ')
-        sql = sql.replace('!=', '<>')
-        sql = sql.replace('!', ' NOT ')
+        # Replace Alteryx field references [FieldName] with "FieldName" and operators
+        sql = _OPERATOR_RE.sub(_replace_operator, sql)
 
-        # Convert functions
-        sql = self._convert_all_functions(sql)
+        # Convert functions (most expressions are plain field references/arithmetic)
+        if _FUNC_CALL_RE.search(sql):
+            sql = self._convert_all_functions(sql)
 
         return sql
 
     def _convert_all_functions(self, expr: str) -> str:
-        """Convert all Alteryx functions in an expression to Trino SQL."""
-        result = expr
-        converted_positions = set()  # Track positions we've already converted
-
-        # Process functions from innermost to outermost
-        max_iterations = 100
-        iteration = 0
-
-        while iteration < max_iterations:
-            # Find all function matches and their positions
-            matches = []
-            for alteryx_func in self.function_map:
-                pattern = rf'\b{re.escape(alteryx_func)}\s*\('
-                for match in re.finditer(pattern, result, re.IGNORECASE):
-                    start_idx = match.start()
-                    paren_start = match.end() - 1
-                    paren_end = self._find_matching_paren(result, paren_start)
-                    if paren_end != -1:
-                        # Get the actual function name from the match
-                        actual_func_name = result[start_idx:paren_start].strip()
-
-                        # Skip if this is an already-converted function (all caps Trino function)
-                        # Alteryx functions use mixed case, Trino uses all caps
-                        if actual_func_name.isupper() and actual_func_name != alteryx_func:
-                            continue
-
-                        # Check if this function has no nested Alteryx functions
-                        args_str = result[paren_start + 1:paren_end]
-                        has_nested = any(
-                            re.search(rf'\b{re.escape(f)}\s*\(', args_str, re.IGNORECASE)
-                            for f in self.function_map
-                            if not result[result.find(f, paren_start + 1):result.find(f, paren_start + 1) + len(f) + 1].rstrip('(').isupper()
-                        )
-                        matches.append((start_idx, paren_start, paren_end, alteryx_func, has_nested, actual_func_name))
-
-            if not matches:
-                break
+        """Convert all Alteryx functions in an expression to Trino SQL.
 
-            # Process innermost functions first (those without nested functions)
-            # If all have nested functions, process the rightmost (deepest) one
-            innermost = [m for m in matches if not m[4]]
-            if innermost:
-                # Pick the first innermost function
-                start_idx, paren_start, paren_end, alteryx_func, _, actual_name = innermost[0]
+        Walks the expression once, skipping quoted strings and matching
+        parentheses with a stack. A call is rewritten when its closing
+        parenthesis is reached, so its arguments have already been converted
+        (innermost first). Calls already converted to Trino (all caps, e.g.
+        TRIM) are left as they are.
+        """
+        out = []  # Converted text, in order
+        # Open parentheses: (index in out of the call head, actual name) for
+        # function calls, None for grouping parentheses
+        stack = []
+        search = _CALL_TOKEN_RE.search
+        copied = 0  # expr[:copied] is already in out
+        pos = 0
+
+        while True:
+            match = search(expr, pos)
+            if match is None:
+                break
+            pos = match.end()
+            actual_func_name = match.group(1)
+
+            if actual_func_name:
+                # Keep the call head ("Trim(" or "Trim (") as its own piece
+                out.append(expr[copied:match.start()])
+                stack.append((len(out), actual_func_name))
+                out.append(expr[match.start():pos])
+                copied = pos
+                continue
+
+            token = match.group(0)
+            if token == '(':
+                stack.append(None)
+            elif token == ')':
+                if not stack:
+                    continue
+                frame = stack.pop()
+                if frame is None:
+                    continue
+                head_idx, actual_func_name = frame
+                out.append(expr[copied:match.start()])
+                copied = pos
+
+                head = out[head_idx]
+                args_str = ''.join(out[head_idx + 1:])
+                del out[head_idx:]
+                trino_expr = self._convert_call(actual_func_name, args_str)
+                out.append(trino_expr or head + args_str + ')')
             else:
-                # Pick the rightmost function (likely deepest nested)
-                matches.sort(key=lambda x: x[0], reverse=True)
-                start_idx, paren_start, paren_end, alteryx_func, _, actual_name = matches[0]
-
-            # Extract and parse arguments
-            args_str = result[paren_start + 1:paren_end]
-            args = self._split_args(args_str)
-
-            # Convert to Trino
-            trino_expr = self._convert_function(alteryx_func, args)
-            if trino_expr:
-                old_result = result
-                result = result[:start_idx] + trino_expr + result[paren_end + 1:]
-                # If no change was made, we're stuck in a loop
-                if result == old_result:
+                # Quote: jump past the closing quote; unterminated strings run to the end
+                close = expr.find(token, pos)
+                if close == -1:
                     break
-            else:
-                # Skip this function if conversion fails
-                break
+                pos = close + 1
 
-            iteration += 1
+        out.append(expr[copied:])
+        return ''.join(out)
 
-        return result
+    def _convert_call(self, actual_func_name: str, args_str: str) -> Optional[str]:
+        """Convert one call found by _convert_all_functions, or return None to keep it."""
+        entry = _FUNC_DISPATCH.get(actual_func_name.casefold())
+        if entry is None:
+            # Matched only through a Unicode case fold (e.g. dotted I); not a call
+            return None
+        alteryx_func = entry[0]
+
+        # Skip already-converted functions (all caps Trino function)
+        # Alteryx functions use mixed case, Trino uses all caps
+        if actual_func_name.isupper() and actual_func_name != alteryx_func:
+            return None
+
+        return self._convert_function(alteryx_func, self._split_args(args_str))
 
     def _convert_function(self, func_name: str, args: list) -> Optional[str]:
         """Convert a single Alteryx function to Trino SQL."""
         # Case-insensitive lookup
-        canonical_name = self._func_name_map.get(func_name.lower())
-        if not canonical_name:
-            self._conversion_notes.append(
-                f"No mapping for Alteryx function: {func_name}"
-            )
-            return None
-
-        mapping = self.function_map.get(canonical_name)
-        if not mapping:
+        entry = _FUNC_DISPATCH.get(func_name.casefold())
+        if entry is None:
+            self._conversion_notes.append(_NO_MAPPING_NOTE + func_name)
             return None
 
-        trino_template, expected_args = mapping
+        _, rewrite, expected_args, placeholder_args = entry
 
-        if trino_template is None:
+        if rewrite is None:
             # Function requires special handling
             return self._handle_special_function(func_name, args)
 
-        if expected_args == 0:
-            # Zero-arg function
-            return trino_template
+        if expected_args > 0 and placeholder_args is not None and len(args) < placeholder_args:
+            self._conversion_notes.append(
+                f"Argument mismatch for {func_name}: expected {expected_args}, got {len(args)}"
+            )
+            return _TODO_FIX_PREFIX + func_name + ' */ ' + func_name + '(' + ', '.join(args) + ')'
 
-        if expected_args == -1:
-            # Variable args - use as-is with same function name
-            return f"{trino_template}({', '.join(args)})"
-
-        if '{' in trino_template:
-            # Template with placeholders
-            try:
-                return trino_template.format(*args)
-            except (IndexError, KeyError):
-                self._conversion_notes.append(
-                    f"Argument mismatch for {func_name}: expected {expected_args}, got {len(args)}"
-                )
-                return f"/* TODO: Fix {func_name} */ {func_name}({', '.join(args)})"
-        else:
-            # Simple function name mapping
-            return f"{trino_template}({', '.join(args)})"
+        return rewrite(args)
 
     def _handle_special_function(self, func_name: str, args: list) -> str:
         """Handle functions that need special conversion logic."""
@@ -385,7 +506,7 @@ class FormulaConverter:
             # Switch(Value, Default, Case1, Result1, ..., CaseN, ResultN)
             # -> CASE Value WHEN Case1 THEN Result1 ... ELSE Default END
             if len(args) < 2:
-                return f"/* Invalid Switch */ NULL"
+                return "/* Invalid Switch */ NULL"
 
             value = args[0]
             default = args[1]
@@ -405,74 +526,56 @@ class FormulaConverter:
 
             return f"CASE {value} {' '.join(case_stmts)} ELSE {default} END"
 
-        return f"/* TODO: Convert {func_name} */ {func_name}({', '.join(args)})"
-
-    def _find_matching_paren(self, expr: str, start: int) -> int:
-        """Find the index of the closing parenthesis matching the one at start."""
-        depth = 1
-        i = start + 1
-        in_string = False
-        string_char = None
-
-        while i < len(expr) and depth > 0:
-            char = expr[i]
-
-            if char in ('"', "'") and not in_string:
-                in_string = True
-                string_char = char
-            elif char == string_char and in_string:
-                in_string = False
-                string_char = None
-            elif not in_string:
-                if char == '(':
-                    depth += 1
-                elif char == ')':
-                    depth -= 1
-
-            i += 1
-
-        return i - 1 if depth == 0 else -1
+        return _TODO_CONVERT_PREFIX + func_name + ' */ ' + func_name + '(' + ', '.join(args) + ')'
 
     def _split_args(self, args_str: str) -> list:
         """Split function arguments respecting nested parentheses and quotes."""
+        if ',' not in args_str:
+            # Single argument (or none): nothing to split
+            arg = args_str.strip()
+            return [arg] if arg else []
+
         args = []
-        current = ""
+        start = 0  # Start of the current argument
         depth = 0
-        in_string = False
-        string_char = None
-
-        for char in args_str:
-            if char in ('"', "'") and not in_string:
-                in_string = True
-                string_char = char
-                current += char
-            elif char == string_char and in_string:
-                in_string = False
-                string_char = None
-                current += char
-            elif char == '(' and not in_string:
+        pos = 0
+        search = _ARG_TOKEN_RE.search
+
+        # Jump between quotes, parentheses and commas; text in between is
+        # copied as one slice per argument
+        while True:
+            match = search(args_str, pos)
+            if match is None:
+                break
+            char = match.group(0)
+            pos = match.end()
+
+            if char == ',':
+                if depth == 0:
+                    args.append(args_str[start:match.start()].strip())
+                    start = pos
+            elif char == '(':
                 depth += 1
-                current += char
-            elif char == ')' and not in_string:
+            elif char == ')':
                 depth -= 1
-                current += char
-            elif char == ',' and depth == 0 and not in_string:
-                args.append(current.strip())
-                current = ""
             else:
-                current += char
+                # Quote: skip to the closing quote; unterminated strings run to the end
+                close = args_str.find(char, pos)
+                if close == -1:
+                    break
+                pos = close + 1
 
-        if current.strip():
-            args.append(current.strip())
+        last = args_str[start:].strip()
+        if last:
+            args.append(last)
 
         return args
 
     def convert_date_format(self, alteryx_format: str) -> str:
         """Convert Alteryx date format string to Trino format string."""
-        result = alteryx_format
-        for alteryx_spec, trino_spec in self.date_format_map.items():
-            result = result.replace(alteryx_spec, trino_spec)
-        return result
+        # Single pass, so a converted specifier is never converted again
+        # (e.g. %A -> %W must not then become %v)
+        return _DATE_FORMAT_RE.sub(lambda m: ALTERYX_DATE_FORMAT_MAP[m.group(0)], alteryx_format)
 
     def get_conversion_notes(self) -> list:
         """Get any notes or warnings from the last conversion."""
@@ -489,8 +592,20 @@ def convert_alteryx_expression(expr: str) -> str:
     Returns:
         Trino SQL expression
     """
-    converter = FormulaConverter()
-    return converter.convert(expr)
+    return _get_thread_converter().convert(expr)
+
+
+# One reusable converter per thread for convert_alteryx_expression; converters
+# keep per-conversion notes, so they are not shared between threads
+_thread_local = threading.local()
+
+
+def _get_thread_converter() -> FormulaConverter:
+    """Return this thread's FormulaConverter, creating it on first use."""
+    converter = getattr(_thread_local, 'converter', None)
+    if converter is None:
+        converter = _thread_local.converter = FormulaConverter()
+    return converter
 
 
 # Mapping of Alteryx aggregation functions for Summarize tool
@@ -543,6 +658,18 @@ ALTERYX_AGGREGATION_TO_TRINO = {
     'AvgDistinct': 'AVG(DISTINCT {0})',
 }
 
+# Aggregation dispatch built once: name -> (mapping, args needed by its
+# placeholders or None for a plain function name, function name fallback)
+_AGGREGATION_DISPATCH: Dict[str, Tuple[str, Optional[int], str]] = {
+    name: (
+        mapping,
+        _template_arg_count(mapping) if '{' in mapping else None,
+        mapping.split('(')[0],
+    )
+    for name, mapping in ALTERYX_AGGREGATION_TO_TRINO.items()
+    if mapping
+}
+
 
 def convert_aggregation(alteryx_agg: str, field: str, *extra_args) -> str:
     """
@@ -556,16 +683,15 @@ def convert_aggregation(alteryx_agg: str, field: str, *extra_args) -> str:
     Returns:
         Trino SQL aggregation expression
     """
-    mapping = ALTERYX_AGGREGATION_TO_TRINO.get(alteryx_agg)
-    if not mapping:
+    entry = _AGGREGATION_DISPATCH.get(alteryx_agg)
+    if entry is None:
         return f"/* TODO: {alteryx_agg} */ {field}"
 
-    if '{' in mapping:
-        # Template with placeholders
-        args = [field] + list(extra_args)
-        try:
-            return mapping.format(*args)
-        except (IndexError, KeyError):
-            return f"{mapping.split('(')[0]}({field})"
-    else:
+    mapping, placeholder_args, function_name = entry
+    if placeholder_args is None:
         return f"{mapping}({field})"
+
+    # Template with placeholders
+    if 1 + len(extra_args) < placeholder_args:
+        return f"{function_name}({field})"
+    return mapping.format(field, *extra_args)
@@ -6,6 +6,12 @@ Target Platform: Starburst (Trino-based)
 Macro Location: dbt_macros/ directory
 """
 
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Mapping, Optional, Union
+
+from tool_mappings import PLUGIN_NAME_MAP
+
 # Comprehensive mapping of Alteryx tools to DBT macros
 TOOL_MACRO_MAP = {
     # Preparation Tools
@@ -352,62 +358,89 @@ TOOL_MACRO_MAP = {
     },
 }
 
+# Reverse index: macro file -> tools mapped to it, in TOOL_MACRO_MAP order
+_tools_by_file = {}
+for _tool_name, _tool_info in TOOL_MACRO_MAP.items():
+    if "macro_file" in _tool_info:
+        _tools_by_file.setdefault(_tool_info["macro_file"], []).append(_tool_name)
+_MACRO_FILE_TO_TOOLS = {
+    macro_file: tuple(tools) for macro_file, tools in _tools_by_file.items()
+}
+del _tools_by_file, _tool_name, _tool_info
+
+# All macro files referenced in the mappings
+_ALL_MACRO_FILES = frozenset(_MACRO_FILE_TO_TOOLS)
+
+@dataclass(frozen=True)
+class MacroContext:
+    """Details of a tool instance that select an alternate macro."""
+    join_type: Optional[str] = None     # Join: e.g. "LEFT", "INNER"
+    sample_type: Optional[str] = None   # Sample: e.g. "first", "random"
+    operation: Optional[str] = None     # RegEx: e.g. "extract", "replace"
+
+
+# Context key selecting an alternate macro, per tool, and how its value is
+# normalized before lookup (join types are matched case-insensitively)
+_ALTERNATE_CONTEXT_KEYS = {
+    "Join": ("join_type", str.upper),
+    "Sample": ("sample_type", None),
+    "RegEx": ("operation", None),
+}
+
+# Read-only macro info per tool, and per (tool name, variant) for alternate macros,
+# built once so lookups never copy or mutate TOOL_MACRO_MAP entries
+_TOOL_MACROS = {
+    tool_name: MappingProxyType(tool_info)
+    for tool_name, tool_info in TOOL_MACRO_MAP.items()
+    if tool_info
+}
+_ALTERNATE_MACROS = {
+    (tool_name, variant): MappingProxyType({**tool_info, "macro": macro})
+    for tool_name, tool_info in TOOL_MACRO_MAP.items()
+    for variant, macro in tool_info.get("alternates", {}).items()
+}
 
-def get_macro_for_tool(tool_name: str, context: dict = None) -> dict:
+
+def get_macro_for_tool(tool_name: str,
+                       context: Union[MacroContext, dict, None] = None) -> Optional[Mapping]:
     """
     Get the appropriate macro information for an Alteryx tool.
 
     Args:
         tool_name: Name of the Alteryx tool (e.g., "Filter", "Join")
-        context: Optional context dict with additional info (e.g., join_type, operation)
+        context: Optional MacroContext (or dict with the same keys) with
+            additional info (e.g., join_type, operation)
 
     Returns:
-        Dict with macro information or None if no mapping exists
+        Read-only mapping with macro information or None if no mapping exists
     """
-    macro_info = TOOL_MACRO_MAP.get(tool_name)
-    if not macro_info:
-        return None
-
     # Check for alternate macros based on context
-    if context and "alternates" in macro_info:
-        alternates = macro_info["alternates"]
-
-        # For joins, use the specific join type
-        if tool_name == "Join" and "join_type" in context:
-            join_type = context["join_type"].upper()
-            if join_type in alternates:
-                macro_info = macro_info.copy()
-                macro_info["macro"] = alternates[join_type]
-
-        # For sample, use the appropriate sampling method
-        elif tool_name == "Sample" and "sample_type" in context:
-            sample_type = context["sample_type"]
-            if sample_type in alternates:
-                macro_info = macro_info.copy()
-                macro_info["macro"] = alternates[sample_type]
-
-        # For regex, use the appropriate operation
-        elif tool_name == "RegEx" and "operation" in context:
-            operation = context["operation"]
-            if operation in alternates:
-                macro_info = macro_info.copy()
-                macro_info["macro"] = alternates[operation]
-
-    return macro_info
-
-
-def get_all_macro_files() -> set:
+    # (join type for joins, sampling method for sample, operation for regex)
+    if context is not None:
+        context_key, normalize = _ALTERNATE_CONTEXT_KEYS.get(tool_name, (None, None))
+        if context_key is not None:
+            if isinstance(context, MacroContext):
+                variant = getattr(context, context_key)
+            else:
+                variant = context.get(context_key)
+            if variant is not None:
+                if normalize is not None:
+                    variant = normalize(variant)
+                alternate = _ALTERNATE_MACROS.get((tool_name, variant))
+                if alternate is not None:
+                    return alternate
+
+    return _TOOL_MACROS.get(tool_name)
+
+
+def get_all_macro_files() -> frozenset:
     """
     Get a set of all macro file names referenced in the mappings.
 
     Returns:
-        Set of macro file names (without .sql extension)
+        Frozen set of macro file names (without .sql extension)
     """
-    macro_files = set()
-    for tool_info in TOOL_MACRO_MAP.values():
-        if "macro_file" in tool_info:
-            macro_files.add(tool_info["macro_file"])
-    return macro_files
+    return _ALL_MACRO_FILES
 
 
 def get_tools_for_macro_file(macro_file: str) -> list:
@@ -420,11 +453,7 @@ def get_tools_for_macro_file(macro_file: str) -> list:
     Returns:
         List of tool names
     """
-    tools = []
-    for tool_name, tool_info in TOOL_MACRO_MAP.items():
-        if tool_info.get("macro_file") == macro_file:
-            tools.append(tool_name)
-    return tools
+    return list(_MACRO_FILE_TO_TOOLS.get(macro_file, ()))
 
 
 def get_macro_coverage_stats() -> dict:
@@ -434,8 +463,6 @@ def get_macro_coverage_stats() -> dict:
     Returns:
         Dict with coverage statistics
     """
-    from tool_mappings import PLUGIN_NAME_MAP
-
     total_tools = len(PLUGIN_NAME_MAP)
     covered_tools = len(TOOL_MACRO_MAP)
     coverage_pct = (covered_tools / total_tools * 100) if total_tools > 0 else 0
@@ -444,6 +471,6 @@ def get_macro_coverage_stats() -> dict:
         "total_alteryx_tools": total_tools,
         "tools_with_macros": covered_tools,
         "coverage_percentage": round(coverage_pct, 1),
-        "macro_files": len(get_all_macro_files()),
+        "macro_files": len(_ALL_MACRO_FILES),
         "tools_without_macros": total_tools - covered_tools,
     }
@@ -17,11 +17,15 @@ Examples:
     python main.py analyze . --macro-dir ./macros     # Specify macro directory
 """
 import argparse
+import os
 import sys
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
-from alteryx_parser import AlteryxParser, parse_workflow
+from alteryx_parser import parse_workflow
 from macro_handler import MacroResolver, MacroInventory
 from doc_generator import DocumentationGenerator
 from dbt_generator import DBTGenerator
@@ -36,16 +40,52 @@ def find_workflows(path: Path, recursive: bool = False) -> List[Path]:
         if path.suffix.lower() in ['.yxmd', '.yxmc', '.yxwz']:
             workflows.append(path)
     elif path.is_dir():
-        pattern = '**/*.yxmd' if recursive else '*.yxmd'
-        workflows.extend(path.glob(pattern))
-
-        # Also find .yxmc (macro) files that might be standalone
-        macro_pattern = '**/*.yxmc' if recursive else '*.yxmc'
-        workflows.extend(path.glob(macro_pattern))
+        # Workflows plus .yxmc (macro) files that might be standalone, in one walk
+        entries = path.rglob('*') if recursive else path.iterdir()
+        workflows.extend(p for p in entries if p.suffix.lower() in ('.yxmd', '.yxmc'))
 
     return sorted(workflows)
 
 
+# Below this many files, parsing inline beats starting worker processes by default
+# (4 sample workflows: ~4 ms inline, ~30 ms with fork, ~0.5 s with spawn)
+_MIN_PARALLEL_PARSE = 16
+
+
+def _parse_now(wf_path: Path) -> Future:
+    """Parse one workflow in this process, returning a completed future."""
+    future = Future()
+    try:
+        future.set_result(parse_workflow(str(wf_path)))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def _parse_all(workflow_files: List[Path], jobs: int) -> Iterator[Tuple[Path, Future]]:
+    """Parse workflows in worker processes, yielding (path, future) in file order.
+
+    future.result() returns the parsed workflow or raises its parse error, with
+    the worker's traceback attached as the cause.
+    """
+    if jobs <= 1 or len(workflow_files) <= 1:
+        for wf_path in workflow_files:
+            yield wf_path, _parse_now(wf_path)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(workflow_files))) as executor:
+        futures = []
+        for wf_path in workflow_files:
+            try:
+                future = executor.submit(parse_workflow, str(wf_path))
+            except BrokenProcessPool as e:
+                # A worker died; report the remaining files as failed
+                future = Future()
+                future.set_exception(e)
+            futures.append(future)
+        yield from zip(workflow_files, futures)
+
+
 def analyze(args) -> int:
     """Main analyze command."""
     target_path = Path(args.path).resolve()
@@ -77,12 +117,19 @@ def analyze(args) -> int:
     # Parse workflows
     workflows: List[AlteryxWorkflow] = []
     macro_inventory = MacroInventory()
-    parser = AlteryxParser()
 
-    for wf_path in workflow_files:
+    # Large batches are parsed in worker processes; results are reported and
+    # their macros resolved (possibly interactively) one at a time, in file order
+    if args.jobs:
+        jobs = args.jobs
+    elif len(workflow_files) >= _MIN_PARALLEL_PARSE:
+        jobs = os.cpu_count() or 1
+    else:
+        jobs = 1
+    for wf_path, parsed in _parse_all(workflow_files, jobs):
         print(f"\nParsing: {wf_path.name}")
         try:
-            workflow = parser.parse(str(wf_path))
+            workflow = parsed.result()
             workflows.append(workflow)
 
             print(f"  - {len(workflow.nodes)} tools")
@@ -102,7 +149,6 @@ def analyze(args) -> int:
         except Exception as e:
             print(f"  Error parsing {wf_path}: {e}")
             if args.verbose:
-                import traceback
                 traceback.print_exc()
 
     if not workflows:
@@ -147,10 +193,15 @@ def analyze(args) -> int:
     print("\n" + "=" * 60)
     print("SUMMARY")
     print("=" * 60)
+    total_tools = total_sources = total_targets = 0
+    for w in workflows:
+        total_tools += len(w.nodes)
+        total_sources += len(w.sources)
+        total_targets += len(w.targets)
     print(f"Workflows analyzed: {len(workflows)}")
-    print(f"Total tools: {sum(len(w.nodes) for w in workflows)}")
-    print(f"Total sources: {sum(len(w.sources) for w in workflows)}")
-    print(f"Total outputs: {sum(len(w.targets) for w in workflows)}")
+    print(f"Total tools: {total_tools}")
+    print(f"Total sources: {total_sources}")
+    print(f"Total outputs: {total_targets}")
 
     macro_summary = macro_inventory.get_summary()
     print(f"Macros found: {macro_summary['found']}")
@@ -163,8 +214,8 @@ def analyze(args) -> int:
     return 0
 
 
-def main():
-    """Main entry point."""
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser."""
     parser = argparse.ArgumentParser(
         description="Alteryx to DBT Documentation Generator",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -198,6 +249,14 @@ Examples:
         help='Recursively search for workflows in subdirectories'
     )
 
+    analyze_parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        metavar='N',
+        help='Number of worker processes used to parse workflows; -j 1 disables the pool '
+             f'(default: CPU count, or inline for fewer than {_MIN_PARALLEL_PARSE} files)'
+    )
+
     analyze_parser.add_argument(
         '-o', '--output',
         help='Output directory for documentation (default: <path>/alteryx_docs)'
@@ -234,11 +293,20 @@ Examples:
         help='Validate generated SQL by running dbt compile (requires dbt to be installed)'
     )
 
+    return parser
+
+
+# The parser is static, so it is built once per process
+_PARSER = _build_parser()
+
+
+def main():
+    """Main entry point."""
     # Parse arguments
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
 
     if args.command is None:
-        parser.print_help()
+        _PARSER.print_help()
         return 1
 
     if args.command == 'analyze':
@@ -1,10 +1,19 @@
 """
 Data models for Alteryx workflow parsing.
 """
+import sys
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 from enum import Enum
 
+# Slotted dataclasses (no per-instance __dict__) where supported (Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _index_is_current(key: Tuple[Optional[list], int], items: list) -> bool:
+    """Whether an index built for key = (list, length) still matches items."""
+    return key[0] is items and key[1] == len(items)
+
 
 class ToolCategory(Enum):
     """Categories of Alteryx tools."""
@@ -31,7 +40,7 @@ class MedallionLayer(Enum):
     GOLD = "gold"      # Business-ready/marts
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AlteryxNode:
     """Represents a single tool/node in an Alteryx workflow."""
     tool_id: int
@@ -61,6 +70,11 @@ class AlteryxNode:
     aggregations: List[Dict[str, str]] = field(default_factory=list)
     selected_fields: List[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Tool names come from a small vocabulary; share one string per name
+        self.tool_type = sys.intern(self.tool_type)
+        self.plugin_name = sys.intern(self.plugin_name)
+
     def get_display_name(self) -> str:
         """Get a human-readable name for the tool."""
         if self.annotation:
@@ -68,19 +82,26 @@ class AlteryxNode:
         return self.plugin_name
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AlteryxConnection:
     """Represents a connection between two tools."""
     origin_id: int
     origin_anchor: str      # Output anchor name (e.g., "Output", "True", "False", "Left", "Right")
     destination_id: int
     destination_anchor: str # Input anchor name (e.g., "Input", "Left", "Right")
+    destination_anchor_lc: str = field(init=False, repr=False, compare=False)  # Lowercased, for anchor lookups
+
+    def __post_init__(self):
+        # Anchor names come from a small vocabulary; share one string per name
+        self.origin_anchor = sys.intern(self.origin_anchor)
+        self.destination_anchor = sys.intern(self.destination_anchor)
+        self.destination_anchor_lc = sys.intern(self.destination_anchor.lower())
 
     def __repr__(self) -> str:
         return f"Connection({self.origin_id}:{self.origin_anchor} -> {self.destination_id}:{self.destination_anchor})"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class WorkflowMetadata:
     """Metadata about the workflow."""
     name: str
@@ -92,35 +113,101 @@ class WorkflowMetadata:
     modified_date: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class AlteryxWorkflow:
     """Complete parsed Alteryx workflow."""
     metadata: WorkflowMetadata
     nodes: List[AlteryxNode] = field(default_factory=list)
     connections: List[AlteryxConnection] = field(default_factory=list)
 
-    # Derived data
-    sources: List[AlteryxNode] = field(default_factory=list)
-    targets: List[AlteryxNode] = field(default_factory=list)
+    # Derived data (sources/targets are derived from nodes, see the properties below)
     macros_used: List[str] = field(default_factory=list)
     missing_macros: List[str] = field(default_factory=list)
 
+    # Lookup indexes below are keyed on the nodes/connections list object and its length:
+    # assigning a new list or adding/removing items rebuilds them, but replacing an
+    # item in place (or changing a node's tool_id/category) is not detected.
+
+    # Lookup index: tool ID -> positions in nodes (all of them, for duplicated IDs)
+    _node_positions: Dict[int, List[int]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _indexed_nodes_key: Tuple[Optional[list], int] = field(
+        default=(None, -1), init=False, repr=False, compare=False)
+
+    # Connections by origin/destination tool ID
+    _out_by_id: Dict[int, List[AlteryxConnection]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _in_by_id: Dict[int, List[AlteryxConnection]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _indexed_connections_key: Tuple[Optional[list], int] = field(
+        default=(None, -1), init=False, repr=False, compare=False)
+
+    # Nodes bucketed by category
+    _nodes_by_category: Dict[ToolCategory, List[AlteryxNode]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _categorized_nodes_key: Tuple[Optional[list], int] = field(
+        default=(None, -1), init=False, repr=False, compare=False)
+
+    @property
+    def nodes_by_category(self) -> Dict[ToolCategory, List[AlteryxNode]]:
+        """Nodes grouped by tool category, each group in workflow order."""
+        if not _index_is_current(self._categorized_nodes_key, self.nodes):
+            by_category: Dict[ToolCategory, List[AlteryxNode]] = {}
+            for node in self.nodes:
+                by_category.setdefault(node.category, []).append(node)
+            self._nodes_by_category = by_category
+            self._categorized_nodes_key = (self.nodes, len(self.nodes))
+        return self._nodes_by_category
+
+    @property
+    def sources(self) -> List[AlteryxNode]:
+        """Input tools, in workflow order."""
+        return self.nodes_by_category.get(ToolCategory.INPUT, [])
+
+    @property
+    def targets(self) -> List[AlteryxNode]:
+        """Output tools, in workflow order."""
+        return self.nodes_by_category.get(ToolCategory.OUTPUT, [])
+
+    def _node_index(self) -> Dict[int, List[int]]:
+        """Return the tool ID -> positions index, rebuilding it if nodes changed."""
+        if not _index_is_current(self._indexed_nodes_key, self.nodes):
+            positions: Dict[int, List[int]] = {}
+            for position, node in enumerate(self.nodes):
+                positions.setdefault(node.tool_id, []).append(position)
+            self._node_positions = positions
+            self._indexed_nodes_key = (self.nodes, len(self.nodes))
+        return self._node_positions
+
+    def _adjacency(self) -> Tuple[Dict[int, List[AlteryxConnection]], Dict[int, List[AlteryxConnection]]]:
+        """Return (outgoing, incoming) connections by tool ID, rebuilding them if connections changed."""
+        if not _index_is_current(self._indexed_connections_key, self.connections):
+            outgoing: Dict[int, List[AlteryxConnection]] = {}
+            incoming: Dict[int, List[AlteryxConnection]] = {}
+            for conn in self.connections:
+                outgoing.setdefault(conn.origin_id, []).append(conn)
+                incoming.setdefault(conn.destination_id, []).append(conn)
+            self._out_by_id = outgoing
+            self._in_by_id = incoming
+            self._indexed_connections_key = (self.connections, len(self.connections))
+        return self._out_by_id, self._in_by_id
+
+    def _nodes_at(self, tool_ids) -> List[AlteryxNode]:
+        """Resolve tool IDs to every node carrying them, in workflow order."""
+        positions = self._node_index()
+        nodes = self.nodes
+        wanted = {p for i in set(tool_ids) for p in positions.get(i, ())}
+        return [nodes[p] for p in sorted(wanted)]
+
     def get_node_by_id(self, tool_id: int) -> Optional[AlteryxNode]:
         """Get a node by its tool ID."""
-        for node in self.nodes:
-            if node.tool_id == tool_id:
-                return node
-        return None
+        positions = self._node_index().get(tool_id)
+        return self.nodes[positions[0]] if positions else None
 
     def get_downstream_nodes(self, tool_id: int) -> List[AlteryxNode]:
         """Get all nodes that receive input from the given tool."""
-        downstream_ids = [c.destination_id for c in self.connections if c.origin_id == tool_id]
-        return [n for n in self.nodes if n.tool_id in downstream_ids]
+        return self._nodes_at(c.destination_id for c in self._adjacency()[0].get(tool_id, ()))
 
     def get_upstream_nodes(self, tool_id: int) -> List[AlteryxNode]:
         """Get all nodes that provide input to the given tool."""
-        upstream_ids = [c.origin_id for c in self.connections if c.destination_id == tool_id]
-        return [n for n in self.nodes if n.tool_id in upstream_ids]
+        return self._nodes_at(c.origin_id for c in self._adjacency()[1].get(tool_id, ()))
 
     def get_upstream_connections(self, tool_id: int) -> List[AlteryxConnection]:
         """Get all connections that feed into the given tool.
@@ -128,7 +215,7 @@ class AlteryxWorkflow:
         Returns connections with full anchor information for tools like Join
         that need to distinguish Left vs Right inputs (HIGH-02 fix).
         """
-        return [c for c in self.connections if c.destination_id == tool_id]
+        return list(self._adjacency()[1].get(tool_id, ()))
 
     def get_upstream_node_by_anchor(self, tool_id: int, anchor: str) -> Optional[AlteryxNode]:
         """Get the upstream node connected to a specific input anchor.
@@ -140,13 +227,14 @@ class AlteryxWorkflow:
         Returns:
             The upstream node connected to that anchor, or None
         """
-        for conn in self.connections:
-            if conn.destination_id == tool_id and conn.destination_anchor.lower() == anchor.lower():
+        anchor = anchor.lower()
+        for conn in self._adjacency()[1].get(tool_id, ()):
+            if conn.destination_anchor_lc == anchor:
                 return self.get_node_by_id(conn.origin_id)
         return None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MacroInfo:
     """Information about a macro."""
     name: str
@@ -159,7 +247,7 @@ class MacroInfo:
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TransformationStep:
     """A single transformation step in the workflow."""
     order: int
@@ -172,7 +260,7 @@ class TransformationStep:
     dbt_hint: Optional[str] = None  # SQL/DBT translation hint
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DataLineage:
     """Data lineage from source to target."""
     source: AlteryxNode
@@ -181,7 +269,7 @@ class DataLineage:
     transformations: List[TransformationStep] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SourceInventory:
     """Inventory of all data sources across workflows."""
     name: str
@@ -191,7 +279,7 @@ class SourceInventory:
     suggested_dbt_source: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TargetInventory:
     """Inventory of all output targets across workflows."""
     name: str
@@ -201,7 +289,7 @@ class TargetInventory:
     suggested_dbt_model: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DBTModel:
     """Represents a suggested DBT model."""
     name: str
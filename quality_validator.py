@@ -9,11 +9,14 @@ Provides validation mechanisms to compare outputs during migration:
 
 Target Platform: Starburst (Trino-based)
 """
+import io
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Set, Tuple
 from datetime import datetime
 from pathlib import Path
 
+from file_writer import MIN_PARALLEL_WRITES, write_files_concurrently
+
 
 @dataclass
 class ColumnValidation:
@@ -71,6 +74,48 @@ class ValidationReport:
     discrepancies: List[str] = field(default_factory=list)
 
 
+# Static "Validation Approach" section of the validation report
+_VALIDATION_APPROACH = (
+    "## Validation Approach\n"
+    "\n"
+    "This validation follows a parallel testing strategy comparing:\n"
+    "\n"
+    "1. **Bronze Layer** (dbt external tables) vs **Raw Layer** (Nasuni raw files)\n"
+    "2. **Silver Layer** (dbt intermediate) vs **Staging** (Alteryx staging outputs)\n"
+    "3. **Gold Layer** (dbt marts) vs **Fed Layer** (Alteryx final outputs)\n"
+    "\n"
+    "### Metrics Compared\n"
+    "\n"
+    "- **Record Counts**: Total number of rows in each dataset\n"
+    "- **Data Point Quantities**: Sum/count of key numeric fields\n"
+    "- **Null Completeness**: Null count per output field\n"
+    "\n"
+)
+
+# Static closing sections of the validation report
+_VALIDATION_NEXT_STEPS = (
+    "## Next Steps\n"
+    "\n"
+    "1. Review any FAIL status validations above\n"
+    "2. Investigate record count discrepancies\n"
+    "3. Check null completeness differences\n"
+    "4. Update DBT models or Alteryx workflows as needed\n"
+    "5. Re-run validation until all tests pass\n"
+    "\n"
+    "## Running Validations\n"
+    "\n"
+    "```bash\n"
+    "# Run all validation tests\n"
+    "dbt test --select tag:validation\n"
+    "\n"
+    "# Run specific layer validations\n"
+    "dbt test --select tag:validation_bronze\n"
+    "dbt test --select tag:validation_silver\n"
+    "dbt test --select tag:validation_gold\n"
+    "```\n"
+)
+
+
 class QualityValidator:
     """
     Generates validation SQL and tests for parallel comparison
@@ -93,40 +138,47 @@ class QualityValidator:
         self.raw_schema = raw_schema
         self.staging_schema = staging_schema
         self.validations: List[TableValidation] = []
-
-    def generate_validation_tests(self, models_info: Dict[str, Any]) -> List[str]:
+        self._ensured_dirs: Set[Path] = set()  # Directories already created by this validator
+        self._run_ts = datetime.now().isoformat()  # Fallback report timestamp, stable for this run
+
+    def _ensure_dir(self, path: Path) -> Path:
+        """Create a directory (and parents) once per validator and return it."""
+        if path not in self._ensured_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(path)
+        return path
+
+    def generate_validation_tests(self, models_info: Dict[str, Any],
+                                  parallel: bool = True) -> List[str]:
         """
         Generate DBT test files for validation.
 
         Args:
             models_info: Dictionary of model information from DBTGenerator
+            parallel: Write the test files concurrently (False writes them in order)
 
         Returns:
             List of generated test file paths
         """
-        test_files = []
-        tests_dir = self.output_dir / "tests" / "validation"
-        tests_dir.mkdir(parents=True, exist_ok=True)
+        pending: List[Tuple[Path, bytes]] = []  # Rendered tests, written after the loop
+        tests_dir = self._ensure_dir(self.output_dir / "tests" / "validation")
 
         for model_name, info in models_info.items():
             layer = info.layer if hasattr(info, 'layer') else 'silver'
 
             # Generate record count test
             count_test = self._generate_record_count_test(model_name, layer)
-            count_test_path = tests_dir / f"validate_count_{model_name}.sql"
-            count_test_path.write_text(count_test)
-            test_files.append(str(count_test_path))
+            pending.append((tests_dir / f"validate_count_{model_name}.sql", count_test.encode('utf-8')))
 
             # Generate null completeness test
             if hasattr(info, 'columns') and info.columns:
                 null_test = self._generate_null_completeness_test(
                     model_name, info.columns, layer
                 )
-                null_test_path = tests_dir / f"validate_nulls_{model_name}.sql"
-                null_test_path.write_text(null_test)
-                test_files.append(str(null_test_path))
+                pending.append((tests_dir / f"validate_nulls_{model_name}.sql", null_test.encode('utf-8')))
 
-        return test_files
+        write_files_concurrently(pending, MIN_PARALLEL_WRITES if parallel else None)
+        return [str(path) for path, _ in pending]
 
     def _generate_record_count_test(self, model_name: str, layer: str) -> str:
         """Generate a DBT test to validate record counts."""
@@ -145,58 +197,48 @@ class QualityValidator:
 -- This test returns rows when there's a count mismatch
 -- A passing test returns 0 rows
 
-WITH dbt_counts AS (
+WITH counts AS (
     SELECT
         '{model_name}' AS model_name,
-        COUNT(*) AS record_count,
+        (SELECT COUNT(*) FROM {{{{ ref('{model_name}') }}}}) AS dbt_count,
+        -- TODO: Replace with actual Alteryx output count
+        -- Option 1: External table pointing to Alteryx YXDB output
+        -- Option 2: Staging table with Alteryx results
+        -- Option 3: Direct comparison to source files
+        -- Example: (SELECT COUNT(*) FROM {{{{ source('alteryx_outputs', '{model_name}') }}}})
+        0 AS alteryx_count,  -- Placeholder
         CURRENT_TIMESTAMP AS validation_timestamp
-    FROM {{{{ ref('{model_name}') }}}}
-),
-
--- TODO: Replace this CTE with actual Alteryx output comparison
--- Option 1: External table pointing to Alteryx YXDB output
--- Option 2: Staging table with Alteryx results
--- Option 3: Direct comparison to source files
-alteryx_counts AS (
-    SELECT
-        '{model_name}' AS model_name,
-        -- TODO: Replace with actual Alteryx output source
-        -- Example: COUNT(*) FROM {{{{ source('alteryx_outputs', '{model_name}') }}}}
-        0 AS record_count,  -- Placeholder
-        CURRENT_TIMESTAMP AS validation_timestamp
-),
-
-comparison AS (
-    SELECT
-        d.model_name,
-        d.record_count AS dbt_count,
-        a.record_count AS alteryx_count,
-        ABS(d.record_count - a.record_count) AS count_difference,
-        CASE
-            WHEN a.record_count = 0 THEN 0
-            ELSE ROUND(100.0 * ABS(d.record_count - a.record_count) / a.record_count, 2)
-        END AS difference_pct,
-        d.validation_timestamp
-    FROM dbt_counts d
-    CROSS JOIN alteryx_counts a
 )
 
--- Return rows only if counts don't match (test fails)
-SELECT *
-FROM comparison
-WHERE count_difference > 0
+-- Return a row only if counts don't match (test fails)
+SELECT
+    model_name,
+    dbt_count,
+    alteryx_count,
+    ABS(dbt_count - alteryx_count) AS count_difference,
+    CASE
+        WHEN alteryx_count = 0 THEN 0
+        ELSE ROUND(100.0 * ABS(dbt_count - alteryx_count) / alteryx_count, 2)
+    END AS difference_pct,
+    validation_timestamp
+FROM counts
+WHERE dbt_count <> alteryx_count
 '''
 
     def _generate_null_completeness_test(self, model_name: str,
                                           columns: List[str], layer: str) -> str:
-        """Generate a DBT test to validate null completeness per column."""
+        """Generate a DBT test to validate null completeness per column.
+
+        Null counts are written as COUNT(*) - COUNT(col) rather than a per-row
+        CASE; connectors that keep column statistics may be able to answer them
+        without a full scan.
+        """
         # Build column null count expressions
         null_counts = []
         for col in columns:
-            safe_col = f'"{col}"' if not col.startswith('"') else col
-            null_counts.append(
-                f"SUM(CASE WHEN {safe_col} IS NULL THEN 1 ELSE 0 END) AS null_count_{col.replace(' ', '_').lower()}"
-            )
+            alias = "null_count_" + col.replace(' ', '_').lower()
+            safe_col = col if col.startswith('"') else f'"{col}"'
+            null_counts.append(f"COUNT(*) - COUNT({safe_col}) AS {alias}")
 
         null_counts_sql = ",\n        ".join(null_counts)
 
@@ -241,28 +283,23 @@ WHERE 1=0  -- Placeholder: modify to actual comparison logic
         Query that returns mismatches (empty = validation passed)
 #}
 
-WITH dbt_counts AS (
-    SELECT COUNT(*) AS record_count
-    FROM {{ ref(dbt_model) }}
-),
-
-alteryx_counts AS (
-    SELECT COUNT(*) AS record_count
-    FROM {{ alteryx_source }}
+WITH counts AS (
+    SELECT
+        (SELECT COUNT(*) FROM {{ ref(dbt_model) }}) AS dbt_count,
+        (SELECT COUNT(*) FROM {{ alteryx_source }}) AS alteryx_count
 ),
 
 comparison AS (
     SELECT
         '{{ dbt_model }}' AS model_name,
-        d.record_count AS dbt_count,
-        a.record_count AS alteryx_count,
-        ABS(d.record_count - a.record_count) AS count_diff,
+        dbt_count,
+        alteryx_count,
+        ABS(dbt_count - alteryx_count) AS count_diff,
         CASE
-            WHEN a.record_count = 0 THEN 100.0
-            ELSE 100.0 * ABS(d.record_count - a.record_count) / a.record_count
+            WHEN alteryx_count = 0 THEN 100.0
+            ELSE 100.0 * ABS(dbt_count - alteryx_count) / alteryx_count
         END AS diff_pct
-    FROM dbt_counts d
-    CROSS JOIN alteryx_counts a
+    FROM counts
 )
 
 SELECT *
@@ -288,14 +325,14 @@ WHERE diff_pct > {{ tolerance_pct }}
 WITH dbt_nulls AS (
     SELECT
         COUNT(*) AS total_records,
-        SUM(CASE WHEN {{ column_name }} IS NULL THEN 1 ELSE 0 END) AS null_count
+        COUNT(*) - COUNT({{ column_name }}) AS null_count
     FROM {{ ref(dbt_model) }}
 ),
 
 alteryx_nulls AS (
     SELECT
         COUNT(*) AS total_records,
-        SUM(CASE WHEN {{ column_name }} IS NULL THEN 1 ELSE 0 END) AS null_count
+        COUNT(*) - COUNT({{ column_name }}) AS null_count
     FROM {{ alteryx_source }}
 ),
 
@@ -350,36 +387,25 @@ FROM (
 
     def generate_validation_documentation(self, report: ValidationReport) -> str:
         """Generate markdown documentation for validation results."""
-        doc = [
-            "# Migration Validation Report",
-            "",
-            f"**Generated:** {report.generated_at or datetime.now().isoformat()}",
-            f"**Report Name:** {report.report_name}",
-            "",
-            "## Summary",
-            "",
-            f"| Metric | Value |",
-            f"|--------|-------|",
-            f"| Total Tables Validated | {report.total_tables_validated} |",
-            f"| Tables Passed | {report.tables_passed} |",
-            f"| Tables Failed | {report.tables_failed} |",
-            f"| Pass Rate | {100 * report.tables_passed / max(report.total_tables_validated, 1):.1f}% |",
-            "",
-            "## Validation Approach",
-            "",
-            "This validation follows a parallel testing strategy comparing:",
-            "",
-            "1. **Bronze Layer** (dbt external tables) vs **Raw Layer** (Nasuni raw files)",
-            "2. **Silver Layer** (dbt intermediate) vs **Staging** (Alteryx staging outputs)",
-            "3. **Gold Layer** (dbt marts) vs **Fed Layer** (Alteryx final outputs)",
-            "",
-            "### Metrics Compared",
-            "",
-            "- **Record Counts**: Total number of rows in each dataset",
-            "- **Data Point Quantities**: Sum/count of key numeric fields",
-            "- **Null Completeness**: Null count per output field",
-            "",
-        ]
+        buf = io.StringIO()
+        write = buf.write
+        write(
+            "# Migration Validation Report\n"
+            "\n"
+            f"**Generated:** {report.generated_at or self._run_ts}\n"
+            f"**Report Name:** {report.report_name}\n"
+            "\n"
+            "## Summary\n"
+            "\n"
+            "| Metric | Value |\n"
+            "|--------|-------|\n"
+            f"| Total Tables Validated | {report.total_tables_validated} |\n"
+            f"| Tables Passed | {report.tables_passed} |\n"
+            f"| Tables Failed | {report.tables_failed} |\n"
+            f"| Pass Rate | {100 * report.tables_passed / max(report.total_tables_validated, 1):.1f}% |\n"
+            "\n"
+        )
+        write(_VALIDATION_APPROACH)
 
         # Add layer-specific results
         for layer_name, validations in [
@@ -388,57 +414,36 @@ FROM (
             ("Gold", report.gold_validations)
         ]:
             if validations:
-                doc.extend([
-                    f"## {layer_name} Layer Validations",
-                    "",
-                    "| Table | DBT Count | Alteryx Count | Diff | Status |",
-                    "|-------|-----------|---------------|------|--------|",
-                ])
+                write(
+                    f"## {layer_name} Layer Validations\n"
+                    "\n"
+                    "| Table | DBT Count | Alteryx Count | Diff | Status |\n"
+                    "|-------|-----------|---------------|------|--------|\n"
+                )
                 for v in validations:
                     status = "PASS" if v.validation_passed else "FAIL"
-                    doc.append(
+                    write(
                         f"| {v.table_name} | {v.dbt_record_count:,} | "
-                        f"{v.alteryx_record_count:,} | {v.record_count_diff:,} | {status} |"
+                        f"{v.alteryx_record_count:,} | {v.record_count_diff:,} | {status} |\n"
                     )
-                doc.append("")
+                write("\n")
 
         # Add discrepancies section
         if report.discrepancies:
-            doc.extend([
-                "## Discrepancies Found",
-                "",
-                "The following issues need resolution before cut-over:",
-                "",
-            ])
+            write(
+                "## Discrepancies Found\n"
+                "\n"
+                "The following issues need resolution before cut-over:\n"
+                "\n"
+            )
             for i, disc in enumerate(report.discrepancies, 1):
-                doc.append(f"{i}. {disc}")
-            doc.append("")
+                write(f"{i}. {disc}\n")
+            write("\n")
 
         # Add next steps
-        doc.extend([
-            "## Next Steps",
-            "",
-            "1. Review any FAIL status validations above",
-            "2. Investigate record count discrepancies",
-            "3. Check null completeness differences",
-            "4. Update DBT models or Alteryx workflows as needed",
-            "5. Re-run validation until all tests pass",
-            "",
-            "## Running Validations",
-            "",
-            "```bash",
-            "# Run all validation tests",
-            "dbt test --select tag:validation",
-            "",
-            "# Run specific layer validations",
-            "dbt test --select tag:validation_bronze",
-            "dbt test --select tag:validation_silver",
-            "dbt test --select tag:validation_gold",
-            "```",
-            "",
-        ])
-
-        return "\n".join(doc)
+        write(_VALIDATION_NEXT_STEPS)
+
+        return buf.getvalue()
 
     def write_validation_outputs(self, dbt_output_dir: Path,
                                   models_info: Dict[str, Any]) -> List[str]:
@@ -455,16 +460,14 @@ FROM (
         created_files = []
 
         # Create tests directory
-        tests_dir = dbt_output_dir / "tests" / "validation"
-        tests_dir.mkdir(parents=True, exist_ok=True)
+        tests_dir = self._ensure_dir(dbt_output_dir / "tests" / "validation")
 
         # Generate validation tests for each model
         test_files = self.generate_validation_tests(models_info)
         created_files.extend(test_files)
 
         # Generate validation macros
-        macros_dir = dbt_output_dir / "macros" / "validation"
-        macros_dir.mkdir(parents=True, exist_ok=True)
+        macros_dir = self._ensure_dir(dbt_output_dir / "macros" / "validation")
 
         macro_content = self.generate_validation_macro()
         macro_path = macros_dir / "validation_macros.sql"
@@ -0,0 +1,58 @@
+"""
+Tests for DBTGenerator expression handling.
+
+Tests that trivial expressions short-circuited by _convert_expression
+produce the expected Trino SQL without going through the formula converter.
+"""
+import os
+import sys
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dbt_generator import DBTGenerator
+
+
+def test_trivial_expressions():
+    """Test keyword, integer, bare column and quoted literal expressions."""
+    generator = DBTGenerator(tempfile.mkdtemp(), interactive=False)
+
+    # Keywords are upper-cased (the formula converter leaves them as written)
+    result = generator._convert_expression('null')
+    assert result == 'NULL', f"Expected NULL, got {result}"
+
+    result = generator._convert_expression('True')
+    assert result == 'TRUE', f"Expected TRUE, got {result}"
+
+    # Integers are returned unchanged
+    result = generator._convert_expression('-5')
+    assert result == '-5', f"Expected -5, got {result}"
+
+    # A bare field reference is quoted
+    result = generator._convert_expression('[Field]')
+    assert result == '"Field"', f"Expected \"Field\", got {result}"
+
+    # Quoted literals are returned verbatim, operators inside them untouched
+    result = generator._convert_expression("'a && b'")
+    assert result == "'a && b'", f"Expected 'a && b', got {result}"
+
+    result = generator._convert_expression('"a && b"')
+    assert result == '"a && b"', f"Expected \"a && b\", got {result}"
+
+    print("[PASS] Trivial expression short-circuits work correctly")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("Testing DBT generator expression handling...\n")
+
+    test_trivial_expressions()
+
+    print("\n" + "=" * 50)
+    print("All tests passed!")
+    print("=" * 50)
+
+
+if __name__ == '__main__':
+    run_all_tests()
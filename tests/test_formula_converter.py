@@ -6,6 +6,7 @@ Trino SQL equivalents.
 """
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -29,6 +30,10 @@ def test_field_references():
     result = converter.convert('[Field1] + [Field2]')
     assert '"Field1"' in result and '"Field2"' in result, f"Got {result}"
 
+    # Operator characters inside a field name are left alone
+    result = converter.convert('[a!b]')
+    assert result == '"a!b"', f"Expected \"a!b\", got {result}"
+
     print("[PASS] Field references conversion works correctly")
 
 
@@ -47,9 +52,32 @@ def test_operator_conversion():
     result = converter.convert('[A] || [B]')
     assert ' OR ' in result, f"Got {result}"
 
+    # Operators outside a field are converted, those inside it are not
+    result = converter.convert('[a!b] != 1')
+    assert result == '"a!b" <> 1', f"Expected \"a!b\" <> 1, got {result}"
+
     print("[PASS] Operator conversion works correctly")
 
 
+def test_call_scanning():
+    """Test that function calls are found by name outside field references only."""
+    converter = FormulaConverter()
+
+    # A field named like a function is not a call
+    result = converter.convert('[Left (cm)]')
+    assert result == '"Left (cm)"', f"Expected \"Left (cm)\", got {result}"
+
+    result = converter.convert('Trim([Left (cm)])')
+    assert result == 'TRIM("Left (cm)")', f"Expected TRIM(\"Left (cm)\"), got {result}"
+
+    # A call nested directly in another converts fully, with no TODO markers
+    result = converter.convert('ACos(PI())')
+    assert result == 'ACOS(PI())', f"Expected ACOS(PI()), got {result}"
+    assert converter.get_conversion_notes() == [], f"Got {converter.get_conversion_notes()}"
+
+    print("[PASS] Call scanning works correctly")
+
+
 def test_iif_conversion():
     """Test IIF to CASE WHEN conversion."""
     converter = FormulaConverter()
@@ -255,12 +283,75 @@ def test_convenience_function():
     print("[PASS] Convenience function works correctly")
 
 
+def test_date_format_conversion():
+    """Test Alteryx date format specifiers are converted to Trino's."""
+    converter = FormulaConverter()
+
+    result = converter.convert_date_format('%Y-%m-%d %H:%M:%S')
+    assert result == '%Y-%m-%d %H:%i:%s', f"Got {result}"
+
+    # Each specifier is converted once: %A -> %W, %W -> %v, %B -> %M
+    result = converter.convert_date_format('%A %W %B')
+    assert result == '%W %v %M', f"Got {result}"
+
+    print("[PASS] Date format conversion works correctly")
+
+
+def test_repeated_conversion_notes():
+    """Test that converting the same expression again reports the same notes."""
+    expr = 'Left([Name])'  # Missing the length argument
+
+    first = FormulaConverter()
+    result1 = first.convert(expr)
+    notes1 = first.get_conversion_notes()
+    assert notes1, "Expected a note for the argument mismatch"
+
+    second = FormulaConverter()
+    result2 = second.convert(expr)
+    assert result2 == result1, f"Expected {result1}, got {result2}"
+    assert second.get_conversion_notes() == notes1, \
+        f"Expected {notes1}, got {second.get_conversion_notes()}"
+
+    # Notes of one conversion must not leak into the next
+    second.convert('[Field1] + [Field2]')
+    assert second.get_conversion_notes() == [], f"Got {second.get_conversion_notes()}"
+
+    print("[PASS] Repeated conversion notes work correctly")
+
+
+def test_threaded_conversion():
+    """Test that threads converting distinct expressions, enough to force cache eviction, all succeed."""
+    FormulaConverter.clear_cache()
+    exprs = [f'Trim([f{i}])' for i in range(10000)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(convert_alteryx_expression, exprs))
+
+    for i, result in enumerate(results):
+        assert result == f'TRIM("f{i}")', f"Got {result}"
+
+    print("[PASS] Threaded conversion works correctly")
+
+
+def test_unconvertible_call_marked_once():
+    """Test that a call that cannot be converted is marked once and its caller still converts."""
+    converter = FormulaConverter()
+
+    result = converter.convert('Trim(Left([Name]))')  # Left is missing the length argument
+    assert result == 'TRIM(/* TODO: Fix Left */ Left("Name"))', f"Got {result}"
+    notes = converter.get_conversion_notes()
+    assert len(notes) == 1, f"Expected one note, got {notes}"
+
+    print("[PASS] Unconvertible calls are marked once")
+
+
 def run_all_tests():
     """Run all tests."""
     print("Testing Alteryx formula converter...\n")
 
     test_field_references()
     test_operator_conversion()
+    test_call_scanning()
     test_iif_conversion()
     test_isnull_conversion()
     test_isempty_conversion()
@@ -273,6 +364,10 @@ def run_all_tests():
     test_complex_expression()
     test_aggregation_conversion()
     test_convenience_function()
+    test_date_format_conversion()
+    test_repeated_conversion_notes()
+    test_threaded_conversion()
+    test_unconvertible_call_marked_once()
 
     print("\n" + "=" * 50)
     print("All formula converter tests passed!")
@@ -0,0 +1,87 @@
+"""
+Tests for AlteryxWorkflow lookups.
+
+Tests that node/connection lookups, sources and targets follow changes
+to the workflow's node and connection lists.
+"""
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models import (
+    AlteryxWorkflow, AlteryxNode, AlteryxConnection, WorkflowMetadata, ToolCategory
+)
+
+
+def _node(tool_id, category=ToolCategory.TRANSFORM):
+    return AlteryxNode(tool_id=tool_id, tool_type="Tool", plugin_name="Tool", category=category)
+
+
+def _connection(origin_id, destination_id):
+    return AlteryxConnection(origin_id, "Output", destination_id, "Input")
+
+
+def _workflow(nodes, connections):
+    return AlteryxWorkflow(WorkflowMetadata("wf", "wf.yxmd"), nodes, connections)
+
+
+def test_same_length_list_replacement():
+    """Test that replacing nodes/connections with same-length lists refreshes lookups."""
+    workflow = _workflow(
+        [_node(1, ToolCategory.INPUT), _node(2), _node(3, ToolCategory.OUTPUT)],
+        [_connection(1, 2), _connection(2, 3)]
+    )
+
+    # Build the indexes before replacing the lists
+    assert [n.tool_id for n in workflow.sources] == [1], f"Got {workflow.sources}"
+    assert [n.tool_id for n in workflow.get_upstream_nodes(3)] == [2]
+
+    workflow.nodes = [_node(4), _node(5, ToolCategory.INPUT), _node(6, ToolCategory.OUTPUT)]
+    workflow.connections = [_connection(5, 4), _connection(4, 6)]
+
+    sources = [n.tool_id for n in workflow.sources]
+    assert sources == [5], f"Expected [5], got {sources}"
+    targets = [n.tool_id for n in workflow.targets]
+    assert targets == [6], f"Expected [6], got {targets}"
+    upstream = [n.tool_id for n in workflow.get_upstream_nodes(6)]
+    assert upstream == [4], f"Expected [4], got {upstream}"
+    assert workflow.get_node_by_id(1) is None, "Expected the replaced node to be gone"
+
+    print("[PASS] Same-length list replacement refreshes lookups")
+
+
+def test_duplicate_tool_ids():
+    """Test that every node sharing a tool ID is returned by upstream/downstream lookups."""
+    first, second = _node(2), _node(2)
+    workflow = _workflow(
+        [_node(1, ToolCategory.INPUT), first, second, _node(3, ToolCategory.OUTPUT)],
+        [_connection(1, 2), _connection(2, 3)]
+    )
+
+    downstream = workflow.get_downstream_nodes(1)
+    assert len(downstream) == 2 and downstream[0] is first and downstream[1] is second, \
+        f"Got {downstream}"
+    upstream = workflow.get_upstream_nodes(3)
+    assert len(upstream) == 2 and upstream[0] is first and upstream[1] is second, \
+        f"Got {upstream}"
+    assert workflow.get_node_by_id(2) is first, "Expected the first node with the ID"
+
+    print("[PASS] Duplicate tool IDs return every matching node")
+
+
+def run_all_tests():
+    """Run all tests."""
+    print("Testing workflow lookups...\n")
+
+    test_same_length_list_replacement()
+    test_duplicate_tool_ids()
+
+    print("\n" + "=" * 50)
+    print("All tests passed!")
+    print("=" * 50)
+
+
+if __name__ == '__main__':
+    run_all_tests()
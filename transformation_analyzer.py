@@ -18,6 +18,10 @@ class TransformationAnalyzer:
     def __init__(self, workflow: AlteryxWorkflow):
         self.workflow = workflow
         self._formula_converter = FormulaConverter()  # Reuse formula_converter for expression conversion
+        # Lazily computed inventories, shared by every caller of this analyzer
+        self._source_inventory: Optional[List[Dict]] = None
+        self._target_inventory: Optional[List[Dict]] = None
+        self._medallion_mapping: Optional[Dict[str, List[AlteryxNode]]] = None
         self._build_graph()
 
     def _build_graph(self):
@@ -279,7 +283,10 @@ class TransformationAnalyzer:
         return paths
 
     def get_source_inventory(self) -> List[Dict]:
-        """Get inventory of all data sources."""
+        """Get inventory of all data sources (computed once per analyzer)."""
+        if self._source_inventory is not None:
+            return self._source_inventory
+
         sources = []
 
         for node in self.workflow.sources:
@@ -293,10 +300,14 @@ class TransformationAnalyzer:
             }
             sources.append(source_info)
 
+        self._source_inventory = sources
         return sources
 
     def get_target_inventory(self) -> List[Dict]:
-        """Get inventory of all output targets."""
+        """Get inventory of all output targets (computed once per analyzer)."""
+        if self._target_inventory is not None:
+            return self._target_inventory
+
         targets = []
 
         for node in self.workflow.targets:
@@ -309,6 +320,7 @@ class TransformationAnalyzer:
             }
             targets.append(target_info)
 
+        self._target_inventory = targets
         return targets
 
     def _determine_source_type(self, node: AlteryxNode) -> str:
@@ -380,7 +392,10 @@ class TransformationAnalyzer:
         return 'Unknown'
 
     def suggest_medallion_mapping(self) -> Dict[str, List[AlteryxNode]]:
-        """Suggest medallion layer assignments for workflow nodes."""
+        """Suggest medallion layer assignments for workflow nodes (computed once per analyzer)."""
+        if self._medallion_mapping is not None:
+            return self._medallion_mapping
+
         mapping = {
             MedallionLayer.BRONZE.value: [],
             MedallionLayer.SILVER.value: [],
@@ -407,4 +422,5 @@ class TransformationAnalyzer:
 
             mapping[layer.value].append(node)
 
+        self._medallion_mapping = mapping
         return mapping